@@ -1,45 +1,210 @@
+from __future__ import annotations
+from bisect import bisect_right
+import mmap
+import re
+import struct
+import sys
 from sys import getsizeof
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+
+NUCLEOTIDES: bytes = b"ACGT"  # nucleotide -> 2 bit code is its position: A=00, C=01, G=10, T=11
+UNKNOWN: bytes = b"N"  # unknown nucleotide, packed as A and restored from the N-mask
+NUCLEOTIDES_PER_BYTE: int = 4
+SEARCH_CHUNK: int = 1 << 16  # nucleotides decoded at a time when searching
+
+# On-disk format, all integers little-endian:
+#   header:  magic, gene length, number of N runs
+#   N-mask:  start of every N run, then length of every N run (uint64 each)
+#   body:    the 2 bit packed nucleotides
+MAGIC: bytes = b"CGN1"
+_HEADER: struct.Struct = struct.Struct("<4sQQ")
+_RUN_FIELD_SIZE: int = 8
+
+_VALID: bytes = NUCLEOTIDES + UNKNOWN + (NUCLEOTIDES + UNKNOWN).lower()
+# byte -> 2 bit code, both for upper and lower case nucleotides (N is packed as A)
+_ENCODE_TABLE: bytes = bytes.maketrans(_VALID, bytes((0, 1, 2, 3, 0)) * 2)
+# packed byte -> the 4 nucleotides it holds, first nucleotide in the highest 2 bits
+_DECODE_TABLE: Tuple[bytes, ...] = tuple(
+    bytes(NUCLEOTIDES[(byte >> shift) & 0b11] for shift in (6, 4, 2, 0))
+    for byte in range(256)
+)
 
 
 class CompressedGene:
     def __init__(self, gene: str) -> None:
+        self._mapped: Optional[mmap.mmap] = None  # set when the gene is opened from a file
         self._compress(gene)
 
     def __str__(self) -> str:
-        b = "bytes: {0:b}\n".format(self.bit_string)
+        b = "bytes: {}\n".format(self.packed.hex())
         s = "string: {}".format(self.decompress())
         return b + s
 
     def _compress(self, gene: str) -> None:
-        self.bit_string: int = 1  # start with sentinel
-        for nucleotide in gene.upper():
-            self.bit_string <<= 2  # shift left 2 bits
-            if nucleotide == "A":
-                self.bit_string |= 0b00  # change last 2 bits to 00
-            elif nucleotide == "C":
-                self.bit_string |= 0b01  # change last 2 bits to 01
-            elif nucleotide == "G":
-                self.bit_string |= 0b10  # change last 2 bits to 10
-            elif nucleotide == "T":
-                self.bit_string |= 0b11
-            else:
-                raise ValueError("Invalid Nucleotide: {}".format(nucleotide))
+        raw: bytes = gene.encode("ascii", errors="replace")  # non-ASCII characters become "?"
+        if raw.translate(None, _VALID):  # anything left is invalid
+            invalid: str = next(n for n in gene.upper() if n not in "ACGTN")
+            raise ValueError("Invalid Nucleotide: {}".format(invalid))
+
+        self.length: int = len(raw)
+        # N-mask: sorted, non-adjacent runs of unknown nucleotides
+        self._n_starts: Sequence[int] = []
+        self._n_lengths: Sequence[int] = []
+        for run in re.finditer(b"[Nn]+", raw):
+            self._n_starts.append(run.start())
+            self._n_lengths.append(run.end() - run.start())
+
+        padding: int = -len(raw) % NUCLEOTIDES_PER_BYTE
+        codes: bytes = raw.translate(_ENCODE_TABLE) + bytes(padding)  # one 2 bit code per byte
+        size: int = len(codes) // NUCLEOTIDES_PER_BYTE
+        # Each code fits in the lowest 2 bits of its byte, so taking every 4th code as one big
+        # int and shifting it by 6, 4, 2 or 0 bits never carries over into the next byte; OR-ing
+        # the four shifted ints packs 4 nucleotides per byte in a handful of linear-time steps.
+        packed: int = 0
+        for offset, shift in enumerate((6, 4, 2, 0)):
+            packed |= int.from_bytes(codes[offset::NUCLEOTIDES_PER_BYTE], "big") << shift
+        self.packed: Union[bytearray, memoryview] = bytearray(packed.to_bytes(size, "big"))
 
     def decompress(self) -> str:
-        gene: str = ""
-        for i in range(0, self.bit_string.bit_length() - 1, 2):  # -1 to exclude sentinel
-            bits: int = self.bit_string >> i & 0b11  # get just 2 relevant bits
-            if bits == 0b00:
-                gene += "A"
-            elif bits ==  0b01:
-                gene += "C"
-            elif bits == 0b10:
-                gene += "G"
-            elif bits == 0b11:
-                gene += "T"
-            else:
-                raise ValueError("Invalid bits: {}".format(bits))
-        return gene[::-1]  # [::-1] reverses string by slicing backwards
+        return self._decode(0, self.length)
+
+    # Decode nucleotides [start, stop) touching only the bytes that hold them
+    def _decode(self, start: int, stop: int) -> str:
+        if start >= stop:
+            return ""
+        first: int = start // NUCLEOTIDES_PER_BYTE
+        last: int = (stop - 1) // NUCLEOTIDES_PER_BYTE + 1
+        window: bytes = b"".join(map(_DECODE_TABLE.__getitem__, self.packed[first:last]))
+        offset: int = first * NUCLEOTIDES_PER_BYTE
+        gene: bytes = window[start - offset:stop - offset]
+
+        run: int = max(bisect_right(self._n_starts, start) - 1, 0)  # first run that may overlap
+        if run < len(self._n_starts) and self._n_starts[run] < stop:
+            masked: bytearray = bytearray(gene)
+            while run < len(self._n_starts) and self._n_starts[run] < stop:
+                run_start: int = max(self._n_starts[run], start)
+                run_stop: int = min(self._n_starts[run] + self._n_lengths[run], stop)
+                if run_start < run_stop:
+                    masked[run_start - start:run_stop - start] = UNKNOWN * (run_stop - run_start)
+                run += 1
+            gene = bytes(masked)
+        return gene.decode("ascii")
+
+    def _is_unknown(self, index: int) -> bool:
+        run: int = bisect_right(self._n_starts, index) - 1
+        return run >= 0 and index < self._n_starts[run] + self._n_lengths[run]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step == 1:
+                return self._decode(start, stop)
+            low, high = (start, stop) if step > 0 else (stop + 1, start + 1)
+            return self._decode(low, high)[start - low::step] if low < high else ""
+
+        index: int = key + self.length if key < 0 else key
+        if not 0 <= index < self.length:
+            raise IndexError("CompressedGene index out of range")
+        if self._is_unknown(index):
+            return UNKNOWN.decode("ascii")
+        byte: int = self.packed[index // NUCLEOTIDES_PER_BYTE]
+        shift: int = 6 - 2 * (index % NUCLEOTIDES_PER_BYTE)
+        return chr(NUCLEOTIDES[(byte >> shift) & 0b11])
+
+    def __contains__(self, sub: str) -> bool:
+        return self.find(sub) != -1
+
+    # Non-overlapping matches of sub within [start, end), like str.find/str.count, decoding the
+    # gene chunk by chunk; consecutive chunks overlap by len(sub) - 1 nucleotides so that matches
+    # straddling a chunk boundary are still found.
+    def _matches(self, sub: str, start: int, end: int) -> Iterator[int]:
+        sub = sub.upper()
+        overlap: int = len(sub) - 1
+        position: int = start  # where the next match may start
+        for chunk_start in range(start, end, SEARCH_CHUNK):
+            chunk_stop: int = min(chunk_start + SEARCH_CHUNK + overlap, end)
+            window: str = self._decode(chunk_start, chunk_stop)
+            index: int = window.find(sub, max(position - chunk_start, 0))
+            while index != -1:
+                yield chunk_start + index
+                position = chunk_start + index + len(sub)
+                index = window.find(sub, position - chunk_start)
+
+    def find(self, sub: str, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        if start is not None and start > self.length:
+            return -1
+        start, end, _ = slice(start, end).indices(self.length)
+        if not sub:
+            return start if start <= end else -1
+        return next(self._matches(sub, start, end), -1)
+
+    def count(self, sub: str, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        if start is not None and start > self.length:
+            return 0
+        start, end, _ = slice(start, end).indices(self.length)
+        if not sub:
+            return max(end - start, 0) + 1 if start <= end else 0
+        return sum(1 for _ in self._matches(sub, start, end))
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, self.length, len(self._n_starts)))
+            for values in (self._n_starts, self._n_lengths):
+                file.write(b"".join(value.to_bytes(_RUN_FIELD_SIZE, "little") for value in values))
+            file.write(self.packed)
+
+    # Open a saved gene without reading it: the body and, on little-endian machines, the N-mask
+    # are views over a read-only memory map, so opening takes constant time, the pages are shared
+    # by every process opening the same file and decoding only touches the bytes it needs.
+    @classmethod
+    def open(cls, path: str) -> CompressedGene:
+        with open(path, "rb") as file:
+            mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            raise ValueError("Not a compressed gene file: {}".format(path))
+        magic, length, runs = _HEADER.unpack_from(mapped)
+        body_start: int = _HEADER.size + 2 * runs * _RUN_FIELD_SIZE
+        body_size: int = -(-length // NUCLEOTIDES_PER_BYTE)
+        if magic != MAGIC or len(mapped) != body_start + body_size:
+            mapped.close()
+            raise ValueError("Not a compressed gene file: {}".format(path))
+
+        gene: CompressedGene = cls.__new__(cls)  # skip compression
+        gene._mapped = mapped
+        gene.length = length
+        view: memoryview = memoryview(mapped)
+        mask: memoryview = view[_HEADER.size:body_start]
+        if sys.byteorder == "little":
+            gene._n_starts = mask[:runs * _RUN_FIELD_SIZE].cast("Q")
+            gene._n_lengths = mask[runs * _RUN_FIELD_SIZE:].cast("Q")
+        else:
+            values: List[int] = [value for value, in struct.iter_unpack("<Q", mask)]
+            gene._n_starts, gene._n_lengths = values[:runs], values[runs:]
+        mask.release()
+        gene.packed = view[body_start:]
+        view.release()
+        return gene
+
+    def close(self) -> None:
+        if self._mapped is None:
+            return
+        for view in (self._n_starts, self._n_lengths, self.packed):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mapped.close()
+        self._mapped = None
+
+    def __enter__(self) -> CompressedGene:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
 
 if __name__ == "__main__":
@@ -47,10 +212,25 @@ if __name__ == "__main__":
     compressed: CompressedGene = CompressedGene(original)
 
     print("-> original gene is {} bytes".format(getsizeof(original)))
-    print("-> compressed gene is {} bytes".format(getsizeof(compressed.bit_string)))
+    print("-> compressed gene is {} bytes".format(getsizeof(compressed.packed)))
     print("-> original and decompressed are the same: {}".format(
         original == compressed.decompress()))
     print()
     print(compressed)  # prints decompressed string
+    print()
+    print("-> length: {}".format(len(compressed)))
+    print("-> nucleotides 10 to 20: {}".format(compressed[10:20]))
+    print("-> first GATC at: {}".format(compressed.find("GATC")))
+    print("-> TATA count: {}".format(compressed.count("TATA")))
+    print()
 
+    from os import close, remove
+    from tempfile import mkstemp
 
+    handle, path = mkstemp(suffix=".cgn")
+    close(handle)
+    CompressedGene("NNNN" + original + "NN").save(path)
+    with CompressedGene.open(path) as mapped_gene:
+        print("-> reopened from {}: {}".format(path, mapped_gene[:12]))
+        print("-> same as in memory: {}".format(mapped_gene.decompress() == "NNNN" + original + "NN"))
+    remove(path)
@@ -1,4 +1,12 @@
+from itertools import accumulate
 from secrets import token_bytes
+from typing import BinaryIO, List, Optional, Sequence, Union
+
+
+Buffer = Union[bytes, bytearray, memoryview]  # type alias for in-memory byte buffers
+
+CHUNK_SIZE: int = 1 << 16  # bytes XOR-ed at a time when streaming
+BATCH_CHUNK_SIZE: int = 1 << 20  # bytes XOR-ed at a time by the batch API
 
 
 def generate_random_key(length: int) -> int:
@@ -18,6 +26,191 @@ def decrypt(key1: int, key2: int) -> str:
     return temp.decode()
 
 
+def xor_bytes(data: Buffer, key: Buffer) -> bytes:
+    if len(data) != len(key):
+        raise ValueError("Data and key must have the same length: {} != {}".format(
+            len(data), len(key)))
+    # the byte length is kept explicitly, so leading NUL bytes survive the round trip
+    xored: int = int.from_bytes(data, "big") ^ int.from_bytes(key, "big")
+    return xored.to_bytes(len(data), "big")
+
+
+# XOR everything read from data with the same number of bytes read from key, chunk by chunk, and
+# write the result to output. Memory use is bounded by chunk_size whatever the size of the data.
+# Returns the number of bytes written.
+def xor_stream(
+    data: BinaryIO,
+    key: BinaryIO,
+    output: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    written: int = 0
+    while True:
+        chunk: bytes = data.read(chunk_size)
+        if not chunk:
+            return written
+        key_chunk: bytes = key.read(len(chunk))
+        while len(key_chunk) < len(chunk):  # key streams may return short reads
+            more: bytes = key.read(len(chunk) - len(key_chunk))
+            if not more:
+                raise ValueError("Key is shorter than the data ({} bytes)".format(
+                    written + len(key_chunk)))
+            key_chunk += more
+        output.write(xor_bytes(chunk, key_chunk))
+        written += len(chunk)
+
+
+# One-time pad over streams: the key is written to key_output as it is generated, so neither the
+# data nor the key is ever held in memory as a whole. Returns the number of bytes encrypted.
+def encrypt_stream(
+    data: BinaryIO,
+    key_output: BinaryIO,
+    output: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    written: int = 0
+    while True:
+        chunk: bytes = data.read(chunk_size)
+        if not chunk:
+            return written
+        key_chunk: bytes = token_bytes(len(chunk))
+        key_output.write(key_chunk)
+        output.write(xor_bytes(chunk, key_chunk))
+        written += len(chunk)
+
+
+# XOR is its own inverse: decrypting is XOR-ing the encrypted stream with the key stream again
+def decrypt_stream(
+    encrypted: BinaryIO,
+    key: BinaryIO,
+    output: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    return xor_stream(encrypted, key, output, chunk_size)
+
+
+def encrypt_file(
+    path: str,
+    key_path: str,
+    encrypted_path: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    with open(path, "rb") as data, open(key_path, "wb") as key, \
+            open(encrypted_path, "wb") as output:
+        return encrypt_stream(data, key, output, chunk_size)
+
+
+def decrypt_file(
+    encrypted_path: str,
+    key_path: str,
+    path: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    with open(encrypted_path, "rb") as encrypted, open(key_path, "rb") as key, \
+            open(path, "wb") as output:
+        return decrypt_stream(encrypted, key, output, chunk_size)
+
+
+def encrypt_buffer(original: Buffer, key: Optional[Buffer] = None) -> tuple[bytes, bytes]:
+    if key is None:
+        key = token_bytes(len(original))
+    return bytes(key), xor_bytes(original, key)
+
+
+def decrypt_buffer(key: Buffer, encrypted: Buffer) -> bytes:
+    return xor_bytes(encrypted, key)
+
+
+BatchOffsets = List[int]  # start of every message in a batch buffer, then the total length
+
+
+def pack_batch(messages: Sequence[Buffer]) -> tuple[bytes, BatchOffsets]:
+    return b"".join(messages), [0, *accumulate(map(len, messages))]
+
+
+# Views of every message of a batch buffer: nothing is copied, so they are only valid as long as
+# the buffer is not reused (call bytes() on the ones to keep)
+def unpack_batch(buffer: Buffer, offsets: BatchOffsets) -> List[memoryview]:
+    return list(map(memoryview(buffer).__getitem__, map(slice, offsets[:-1], offsets[1:])))
+
+
+# XOR a whole batch of messages laid end to end with its keys, in large chunks, into a single
+# output buffer instead of building one big int per message. output may be preallocated (and
+# larger than the batch) to be reused across batches.
+def xor_batch(
+    data: Buffer,
+    key: Buffer,
+    output: Optional[bytearray] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+) -> bytearray:
+    if len(data) != len(key):
+        raise ValueError("Data and key must have the same length: {} != {}".format(
+            len(data), len(key)))
+    total: int = len(data)
+    if output is None:
+        output = bytearray(total)
+    elif len(output) < total:
+        raise ValueError("Output buffer is too small: {} < {}".format(len(output), total))
+
+    data_view: memoryview = memoryview(data)
+    key_view: memoryview = memoryview(key)
+    for start in range(0, total, chunk_size):
+        stop: int = min(start + chunk_size, total)
+        output[start:stop] = xor_bytes(data_view[start:stop], key_view[start:stop])
+    return output
+
+
+# Encrypt many messages at once with a single random pad; message i is
+# pad[offsets[i]:offsets[i + 1]] and encrypted[offsets[i]:offsets[i + 1]]. Batching saves the
+# per message int conversions, which pays off for many small messages (up to a few hundred
+# bytes); for larger ones the work is dominated by the XOR itself and the int based
+# encrypt/decrypt are as fast or faster (see benchmark).
+def encrypt_batch(
+    messages: Sequence[Buffer],
+    output: Optional[bytearray] = None,
+) -> tuple[bytes, bytearray, BatchOffsets]:
+    data, offsets = pack_batch(messages)
+    pad: bytes = token_bytes(len(data))
+    return pad, xor_batch(data, pad, output), offsets
+
+
+def decrypt_batch(
+    pad: Buffer,
+    encrypted: Buffer,
+    offsets: BatchOffsets,
+    output: Optional[bytearray] = None,
+) -> List[memoryview]:
+    total: int = offsets[-1]
+    decrypted: bytearray = xor_batch(memoryview(encrypted)[:total], memoryview(pad)[:total], output)
+    return unpack_batch(decrypted, offsets)  # views of output, decrypted in place
+
+
+# Compare the int-based encrypt/decrypt with the batch API, about 4 MB worth of messages per size;
+# the batch API is faster for small messages only, above ~1 KB the ratio drops below 1
+def benchmark() -> None:
+    from time import perf_counter
+
+    for exponent in range(4, 27, 2):  # 16 B to 64 MB
+        size: int = 1 << exponent
+        count: int = max(1, (1 << 22) // size)
+        texts: List[str] = ["a" * size] * count
+        messages: List[bytes] = [text.encode() for text in texts]
+
+        start: float = perf_counter()
+        for text in texts:
+            decrypt(*encrypt(text))
+        int_time: float = perf_counter() - start
+
+        output: bytearray = bytearray(size * count)
+        start = perf_counter()
+        pad, encrypted, offsets = encrypt_batch(messages)
+        decrypt_batch(pad, encrypted, offsets, output)
+        batch_time: float = perf_counter() - start
+
+        print("{:>9} B x {:>6}: int {:.4f}s, batch {:.4f}s ({:.1f}x)".format(
+            size, count, int_time, batch_time, int_time / batch_time))
+
+
 if __name__ == "__main__":
     original: str = "Amanda"
 
@@ -28,3 +221,22 @@ if __name__ == "__main__":
     print("-> original and decrypted are the same: {}".format(original == decrypted))
     print("-> original: {}".format(original))
     print("-> decrypted: {}".format(decrypted))
+    print()
+
+    from io import BytesIO
+
+    message: bytes = b"\x00\x00" + original.encode()  # leading NUL bytes are kept
+    data, key, encrypted = BytesIO(message), BytesIO(), BytesIO()
+    encrypt_stream(data, key, encrypted, chunk_size=4)
+    key.seek(0)
+    encrypted.seek(0)
+    restored: BytesIO = BytesIO()
+    decrypt_stream(encrypted, key, restored, chunk_size=4)
+    print("-> streamed original and decrypted are the same: {}".format(
+        message == restored.getvalue()))
+
+    import sys
+
+    if "--benchmark" in sys.argv:
+        print()
+        benchmark()
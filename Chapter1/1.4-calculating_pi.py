@@ -1,3 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Context, Decimal
+from itertools import islice
+from math import fsum, isqrt
+from os import cpu_count
+from typing import Generator, List, Optional, Tuple
+
+
 def calculate_pi(n_terms: int) -> float:
     numerator: float = 4.0
     denominator: float = 1.0
@@ -12,6 +20,103 @@ def calculate_pi(n_terms: int) -> float:
     return pi
 
 
+# Same series as calculate_pi, yielding the estimate after every term in a single pass
+def leibniz_partial_sums(n_terms: Optional[int] = None) -> Generator[float, None, None]:
+    numerator: float = 4.0
+    denominator: float = 1.0
+    operation: float = 1.0
+    pi: float = 0.0
+
+    while n_terms is None or denominator < 2 * n_terms:
+        pi += operation * (numerator / denominator)
+        denominator += 2.0
+        operation *= -1.0
+        yield pi
+
+
+# Euler transform of the Leibniz series: repeatedly averaging consecutive partial sums cancels
+# most of the alternating error, so ~50 terms already reach float precision.
+def euler_accelerated_pi(n_terms: int = 50) -> float:
+    sums: List[float] = list(leibniz_partial_sums(n_terms))
+    while len(sums) > 1:
+        sums = [(a + b) / 2 for a, b in zip(sums, sums[1:])]
+    return sums[0] if sums else 0.0
+
+
+# Terms [start, stop) of the Leibniz series, summed exactly rounded
+def leibniz_block(start: int, stop: int) -> float:
+    return fsum((-4.0 if k % 2 else 4.0) / (2 * k + 1) for k in range(start, stop))
+
+
+# Leibniz series over a large number of terms, split in blocks summed by a process pool
+def parallel_leibniz_pi(n_terms: int, workers: Optional[int] = None, blocks: int = 64) -> float:
+    workers = workers or cpu_count() or 1
+    size: int = max(-(-n_terms // blocks), 1)  # ceiling division
+    starts: List[int] = list(range(0, n_terms, size))
+    stops: List[int] = [min(start + size, n_terms) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return fsum(pool.map(leibniz_block, starts, stops))
+
+
+# arctan(1 / x) as a fixed point integer scaled by one
+def _arctan_inverse(x: int, one: int) -> int:
+    power: int = one // x
+    total: int = power
+    x_squared: int = x * x
+    n: int = 3
+    sign: int = -1
+    while power:
+        power //= x_squared
+        total += sign * (power // n)
+        sign = -sign
+        n += 2
+    return total
+
+
+# Machin's formula: pi = 16 * arctan(1 / 5) - 4 * arctan(1 / 239)
+def machin_pi(digits: int) -> Decimal:
+    guard: int = 10  # extra digits absorbing the truncation errors
+    one: int = 10 ** (digits + guard)
+    pi: int = 16 * _arctan_inverse(5, one) - 4 * _arctan_inverse(239, one)
+    return Decimal(pi // 10 ** guard).scaleb(-digits, Context(prec=digits + 1))
+
+
+_C3_OVER_24: int = 640320 ** 3 // 24
+
+
+# Binary splitting of the Chudnovsky series terms [a, b), returning P(a, b), Q(a, b), T(a, b)
+def _chudnovsky_split(a: int, b: int) -> Tuple[int, int, int]:
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * _C3_OVER_24
+        t: int = p * (13591409 + 545140134 * a)
+        return p, q, -t if a % 2 else t
+
+    m: int = (a + b) // 2
+    p_am, q_am, t_am = _chudnovsky_split(a, m)
+    p_mb, q_mb, t_mb = _chudnovsky_split(m, b)
+    return p_am * p_mb, q_am * q_mb, q_mb * t_am + p_am * t_mb
+
+
+# Chudnovsky series with binary splitting: ~14 digits per term, for arbitrary precision
+def chudnovsky_pi(digits: int) -> Decimal:
+    guard: int = 10
+    one: int = 10 ** (digits + guard)
+    n_terms: int = digits // 14 + 2
+    _, q, t = _chudnovsky_split(0, n_terms)
+    sqrt_c: int = isqrt(10005 * one * one)
+    pi: int = (q * 426880 * sqrt_c) // t
+    return Decimal(pi // 10 ** guard).scaleb(-digits, Context(prec=digits + 1))
+
+
 if __name__ == "__main__":
-    for i in range (200):
-        print("{} -> {}".format(i, calculate_pi(i)))
+    for i, pi in enumerate(islice(leibniz_partial_sums(), 200), 1):
+        print("{} -> {}".format(i, pi))
+    print()
+    print("Euler accelerated -> {}".format(euler_accelerated_pi()))
+    print("Parallel Leibniz (10^7 terms) -> {}".format(parallel_leibniz_pi(10 ** 7)))
+    print("Machin (50 digits) -> {}".format(machin_pi(50)))
+    print("Chudnovsky (50 digits) -> {}".format(chudnovsky_pi(50)))
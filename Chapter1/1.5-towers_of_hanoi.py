@@ -1,5 +1,9 @@
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, Dict, Iterator, List, Sequence, Tuple
 T = TypeVar('T')
+Move = Tuple[int, int, int]  # type alias for moves: (disc, from tower, to tower)
+
+# (discs, towers) -> (minimum number of moves, discs parked on an intermediate tower first)
+frame_stewart_table: Dict[Tuple[int, int], Tuple[int, int]] = {}
 
 
 class Stack(Generic[T]):
@@ -29,6 +33,123 @@ def hanoi(start: Stack[int], end: Stack[int], temp: Stack[int], n: int) -> None:
         hanoi(temp, end, start, n - 1)
 
 
+# Iterative solver. Towers are numbered 0, 1 and 2 and discs are labelled as they are pushed on
+# tower_a: 1 is the largest disc, n the smallest. Move m (1-based) moves the disc matching the
+# lowest set bit of m, and the towers involved follow from the binary (Gray code) form of m, so
+# moves are produced lazily in O(1) each without recursion nor any tower being materialized.
+def hanoi_moves(n: int, start: int = 0, end: int = 2, temp: int = 1) -> Iterator[Move]:
+    # the closed form moves the tower from 0 to 2 for odd n and from 0 to 1 for even n
+    towers: Tuple[int, int, int] = (start, end, temp) if n % 2 == 0 else (start, temp, end)
+    for m in range(1, 2 ** n):
+        disc: int = n - ((m & -m).bit_length() - 1)
+        yield disc, towers[(m & (m - 1)) % 3], towers[((m | (m - 1)) + 1) % 3]
+
+
+# The k-th move (1-based) of hanoi_moves in O(n), without replaying the previous ones
+def hanoi_move(n: int, k: int, start: int = 0, end: int = 2, temp: int = 1) -> Move:
+    if not 1 <= k < 2 ** n:
+        raise IndexError("Move {} does not exist for {} discs".format(k, n))
+    disc: int = 1  # largest disc still moving
+    while True:
+        half: int = 2 ** (n - disc)  # the current largest disc moves at this step
+        if k == half:
+            return disc, start, end
+        if k < half:  # still moving the smaller discs out of the way
+            end, temp = temp, end
+        else:  # moving the smaller discs back on top of it
+            k -= half
+            start, temp = temp, start
+        disc += 1
+
+
+# The towers (bottom to top) after k moves in O(n), without replaying the moves
+def hanoi_configuration(
+    n: int,
+    k: int,
+    start: int = 0,
+    end: int = 2,
+    temp: int = 1,
+) -> List[List[int]]:
+    if not 0 <= k < 2 ** n:
+        raise IndexError("Move {} does not exist for {} discs".format(k, n))
+    towers: List[List[int]] = [[], [], []]
+    for disc in range(1, n + 1):  # from the largest disc to the smallest one
+        half: int = 2 ** (n - disc)
+        if k < half:  # this disc has not moved yet
+            towers[start].append(disc)
+            end, temp = temp, end
+        else:  # this disc already moved
+            towers[end].append(disc)
+            k -= half
+            start, temp = temp, start
+    return towers
+
+
+# Same result as hanoi, applying the moves of hanoi_moves to the stacks
+def hanoi_iterative(start: Stack[int], end: Stack[int], temp: Stack[int], n: int) -> None:
+    towers: Tuple[Stack[int], Stack[int], Stack[int]] = (start, temp, end)
+    for _, source, target in hanoi_moves(n):
+        towers[target].push(towers[source].pop())
+
+
+# Frame-Stewart for k >= 3 towers: park the top split discs on an intermediate tower using all k
+# towers, move the remaining discs with the other k - 1 towers, then bring the parked discs back.
+# Optimal splits are filled in bottom-up for every smaller (discs, towers) pair, so the table is
+# built once and any later query it covers is a dictionary lookup.
+def _fill_frame_stewart_table(n: int, k: int) -> None:
+    for towers in range(3, k + 1):
+        for discs in range(n + 1):
+            if (discs, towers) in frame_stewart_table:
+                continue
+            if towers == 3 or discs < 2:
+                frame_stewart_table[(discs, towers)] = (2 ** discs - 1, max(discs - 1, 0))
+                continue
+            frame_stewart_table[(discs, towers)] = min(
+                (2 * frame_stewart_table[(split, towers)][0]
+                    + frame_stewart_table[(discs - split, towers - 1)][0], split)
+                for split in range(1, discs)
+            )
+
+
+def frame_stewart(n: int, k: int) -> Tuple[int, int]:
+    if k < 3:
+        raise ValueError("At least 3 towers are needed, got {}".format(k))
+    if (n, k) not in frame_stewart_table:
+        _fill_frame_stewart_table(n, k)
+    return frame_stewart_table[(n, k)]
+
+
+# Frame-Stewart moves from tower 0 to tower k - 1, produced lazily with an explicit task stack;
+# discs are labelled as in hanoi_moves (1 is the largest one).
+def frame_stewart_moves(n: int, k: int = 4) -> Iterator[Move]:
+    frame_stewart(n, k)  # warm up the table for every sub-problem
+    # tasks: (discs, label of the largest one, from, to, free towers)
+    tasks: List[Tuple[int, int, int, int, Tuple[int, ...]]] = [
+        (n, 1, 0, k - 1, tuple(range(1, k - 1)))
+    ]
+    while tasks:
+        discs, largest, start, end, free = tasks.pop()
+        if discs == 0:
+            continue
+        if len(free) == 1:  # plain 3 towers problem
+            for disc, source, target in hanoi_moves(discs, start, end, free[0]):
+                yield largest + disc - 1, source, target
+            continue
+        split: int = frame_stewart_table[(discs, len(free) + 2)][1]
+        top: int = largest + discs - split  # label of the largest parked disc
+        park: int = free[0]
+        # pushed in reverse order of execution
+        tasks.append((split, top, park, end, (start,) + free[1:]))
+        tasks.append((discs - split, largest, start, end, free[1:]))
+        tasks.append((split, top, start, park, (end,) + free[1:]))
+
+
+# Same as hanoi for any number of towers, moving the discs from towers[0] to towers[-1]
+def hanoi_multi(towers: Sequence[Stack[int]], n: int) -> None:
+    for _, source, target in frame_stewart_moves(n, len(towers)):
+        towers[target].push(towers[source].pop())
+
+
 num_discs: int = 3
 tower_a: Stack[int] = Stack()
 tower_b: Stack[int] = Stack()
@@ -41,3 +162,15 @@ if __name__ == "__main__":
     print([tower_a, tower_b, tower_c])
     hanoi(tower_a, tower_c, tower_b, num_discs)
     print([tower_a, tower_b, tower_c])
+    hanoi_iterative(tower_c, tower_a, tower_b, num_discs)
+    print([tower_a, tower_b, tower_c])
+
+    print("-> moves for {} discs: {}".format(num_discs, list(hanoi_moves(num_discs))))
+    print("-> move 2 ** 99 of 100 discs: {}".format(hanoi_move(100, 2 ** 99)))
+    print("-> towers after 5 moves: {}".format(hanoi_configuration(num_discs, 5)))
+
+    tower_d: Stack[int] = Stack()
+    hanoi_multi([tower_a, tower_b, tower_c, tower_d], num_discs)
+    print([tower_a, tower_b, tower_c, tower_d])
+    for discs in (10, 20, 64):
+        print("-> moves for {} discs on 4 towers: {}".format(discs, frame_stewart(discs, 4)[0]))
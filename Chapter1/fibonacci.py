@@ -0,0 +1,156 @@
+# Fast doubling Fibonacci: O(log n) big-int multiplications per query, using
+#   F(2k) = F(k) * (2 * F(k + 1) - F(k))
+#   F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+# Results are anchored on checkpoints (multiples of CHECKPOINT_INTERVAL) kept in a bounded LRU
+# cache, so repeated queries near an already seen index only pay for a short jump.
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Generator, List, Optional, Tuple
+
+
+FibPair = Tuple[int, int]  # type alias for (F(n), F(n + 1))
+FibState = Tuple[int, int, int, Optional[int]]  # (index, F(index), F(index + 1), modulus)
+
+CHECKPOINT_INTERVAL: int = 1 << 12  # distance between two cached checkpoints
+CACHE_SIZE: int = 64  # maximum number of checkpoints kept in memory
+
+
+def _fast_doubling(n: int, modulus: Optional[int] = None) -> FibPair:
+    a: int = 0  # F(k), starting with k = 0
+    b: int = 1  # F(k + 1)
+    for bit in bin(n)[2:]:  # walk the bits of n from the most significant one
+        a, b = a * (2 * b - a), a * a + b * b  # k -> 2k
+        if bit == "1":
+            a, b = b, a + b  # 2k -> 2k + 1
+        if modulus is not None:  # keep the operands small in modular mode
+            a, b = a % modulus, b % modulus
+    if modulus is not None:
+        return a % modulus, b % modulus  # modulus == 1 on n == 0
+    return a, b
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _checkpoint(n: int) -> FibPair:
+    return _fast_doubling(n)
+
+
+def fib_pair(n: int) -> FibPair:
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative: {}".format(n))
+
+    base: int = n - n % CHECKPOINT_INTERVAL  # closest checkpoint at or below n
+    fm, fm1 = _checkpoint(base)
+    if base == n:
+        return fm, fm1
+
+    # jump from the checkpoint with the addition formula, where F(k) and F(k + 1) are small:
+    #   F(m + k) = F(m) * F(k + 1) + F(m - 1) * F(k)
+    #   F(m + k + 1) = F(m + 1) * F(k + 1) + F(m) * F(k)
+    fk, fk1 = _fast_doubling(n - base)
+    return fm * fk1 + (fm1 - fm) * fk, fm1 * fk1 + fm * fk
+
+
+def fib(n: int) -> int:
+    return fib_pair(n)[0]
+
+
+def fib_range(start: int, stop: int) -> List[int]:
+    # same semantics as range(start, stop): F(start), ..., F(stop - 1)
+    if stop <= start:
+        return []
+
+    last, next = fib_pair(start)
+    result: List[int] = [last]
+    for _ in range(start + 1, stop):
+        last, next = next, last + next
+        result.append(last)
+    return result
+
+
+def clear_cache() -> None:
+    _checkpoint.cache_clear()
+
+
+# Resumable stream of Fibonacci numbers: it can start at any index (seeded with a fast doubling
+# jump), hand out terms one by one or in batches, and be snapshotted and restored later. With a
+# modulus every term is reduced, so memory and cost per step stay constant.
+class FibonacciStream:
+    def __init__(self, start: int = 0, modulus: Optional[int] = None) -> None:
+        if start < 0:
+            raise ValueError("Fibonacci index must be non-negative: {}".format(start))
+        if modulus is not None and modulus < 1:
+            raise ValueError("Modulus must be positive: {}".format(modulus))
+
+        self.modulus: Optional[int] = modulus
+        self.index: int = start  # index of the next term to be produced
+        if modulus is None:
+            self._last, self._next = fib_pair(start)
+        else:
+            self._last, self._next = _fast_doubling(start, modulus)
+
+    def __iter__(self) -> FibonacciStream:
+        return self
+
+    def __next__(self) -> int:
+        value: int = self._last
+        if self.modulus is None:
+            self._last, self._next = self._next, self._last + self._next
+        else:
+            self._last, self._next = self._next, (self._last + self._next) % self.modulus
+        self.index += 1
+        return value
+
+    def take(self, size: int) -> List[int]:
+        return [next(self) for _ in range(size)]
+
+    def batches(self, size: int) -> Generator[List[int], None, None]:
+        if size < 1:
+            raise ValueError("Batch size must be positive: {}".format(size))
+        while True:
+            yield self.take(size)
+
+    def snapshot(self) -> FibState:
+        return self.index, self._last, self._next, self.modulus
+
+    @classmethod
+    def restore(cls, state: FibState) -> FibonacciStream:
+        stream: FibonacciStream = cls.__new__(cls)  # skip the seeding jump
+        stream.index, stream._last, stream._next, stream.modulus = state
+        return stream
+
+
+def fib_stream(
+    start: int = 0,
+    stop: Optional[int] = None,
+    modulus: Optional[int] = None,
+) -> Generator[int, None, None]:
+    # F(start), ..., F(stop - 1), or endless when stop is None
+    stream: FibonacciStream = FibonacciStream(start, modulus)
+    while stop is None or stream.index < stop:
+        yield next(stream)
+
+
+def pisano_period(modulus: int) -> int:
+    # length of the cycle of Fibonacci numbers modulo m, which always starts with 0, 1
+    stream: FibonacciStream = FibonacciStream(0, modulus)
+    for period in range(1, 6 * modulus + 1):  # the period never exceeds 6m
+        next(stream)
+        if stream.snapshot()[1:3] == (0, 1 % modulus):
+            return period
+    raise ArithmeticError("No Pisano period found for modulus {}".format(modulus))
+
+
+if __name__ == "__main__":
+    for i in range(10):
+        print("{} ->".format(i), fib(i))
+    print("fib_range(10, 20) ->", fib_range(10, 20))
+    print("bits in fib(1_000_000) ->", fib(1_000_000).bit_length())
+    print("checkpoint cache ->", _checkpoint.cache_info())
+
+    stream: FibonacciStream = FibonacciStream(10_000_000, modulus=1_000_000_007)
+    print("F(10_000_000 + k) mod 1e9+7 ->", stream.take(5))
+    state: FibState = stream.snapshot()
+    print("next batch ->", next(stream.batches(3)))
+    print("restored batch ->", FibonacciStream.restore(state).take(3))
+    print("pisano period of 10 ->", pisano_period(10))
@@ -1,11 +1,44 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
 from enum import IntEnum
-from typing import Tuple, List
+import struct
+import sys
+from typing import Deque, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
 
 
 Nucleotide: IntEnum = IntEnum('Nucleotide', ('A', 'C', 'G', 'T'))
 Codon = Tuple[Nucleotide, Nucleotide, Nucleotide]  # type alias for codons
 Gene = List[Codon]  # type alias for genes
 
+# Compact genes: every codon is a 6 bit id, 16 * first + 4 * second + third nucleotide with
+# A=0, C=1, G=2, T=3, one byte each in an array('B'). Ids sort in the same order as Codon tuples.
+CODON_COUNT: int = 64
+_NUCLEOTIDE_CODES: bytes = bytes.maketrans(b"ACGT", bytes((0, 1, 2, 3)))
+
+Motif = Union[str, Codon, Gene]  # type alias for motifs, as nucleotides or as codons
+MotifMatch = Tuple[int, int]  # (position of the motif's first nucleotide, index of the motif)
+FastaMatch = Tuple[str, int, int]  # (record name, position within the record, index of the motif)
+MATCH_CHUNK_SIZE: int = 1 << 16  # characters read at a time when scanning a file
+_BREAK: int = 4  # code of anything but a nucleotide (N, IUPAC codes...): no match spans it
+_WHITESPACE: bytes = b" \t\r\n"  # dropped from scanned sequences
+# any character -> nucleotide code, upper or lower case, or _BREAK
+_MATCH_CODES: bytes = bytes(
+    b"ACGTacgt".index(byte) % 4 if byte in b"ACGTacgt" else _BREAK for byte in range(256))
+
+# FM-index: the text is A=1, C=2, G=3, T=4 followed by the unique, smallest sentinel 0
+_FM_CODES: bytes = bytes.maketrans(b"ACGT", bytes((1, 2, 3, 4)))
+OCC_SAMPLE: int = 64  # BWT rows between two occurrence checkpoints
+SA_SAMPLE: int = 32  # text positions between two sampled suffix array entries
+# On-disk format, all integers little-endian:
+#   header:   magic, text length n, OCC_SAMPLE, SA_SAMPLE used
+#   BWT:      n + 1 codes, one byte each
+#   marks:    n + 1 bytes, 1 for the rows whose suffix array entry is sampled
+#   samples:  the sampled suffix array entries in row order (uint64 each)
+FM_MAGIC: bytes = b"FMI1"
+_FM_HEADER: struct.Struct = struct.Struct("<4sQII")
+
 
 def string_to_gene(s: str) -> Gene:
     gene: Gene = []
@@ -17,6 +50,75 @@ def string_to_gene(s: str) -> Gene:
     return gene
 
 
+def codon_to_id(codon: Codon) -> int:
+    return (codon[0] - 1) * 16 + (codon[1] - 1) * 4 + (codon[2] - 1)
+
+
+def id_to_codon(codon_id: int) -> Codon:
+    return (Nucleotide(codon_id // 16 + 1), Nucleotide(codon_id // 4 % 4 + 1),
+            Nucleotide(codon_id % 4 + 1))
+
+
+# Same codons as string_to_gene (a trailing incomplete codon is dropped), without building tuples
+def string_to_codon_ids(s: str) -> array:
+    raw: bytes = s[:len(s) - len(s) % 3].encode("ascii", errors="replace")
+    if raw.translate(None, b"ACGT"):  # anything left is invalid
+        invalid: str = next(n for n in s if n not in "ACGT")
+        raise ValueError("Invalid Nucleotide: {}".format(invalid))
+    codes: bytes = raw.translate(_NUCLEOTIDE_CODES)
+    # Every code fits in 2 bits, so the first nucleotides of all codons taken as one big int and
+    # shifted by 4, the second ones shifted by 2 and the third ones never overlap within a byte:
+    # OR-ing the three ints computes every codon id at once.
+    ids: int = (int.from_bytes(codes[0::3], "big") << 4 | int.from_bytes(codes[1::3], "big") << 2
+                | int.from_bytes(codes[2::3], "big"))
+    return array('B', ids.to_bytes(len(codes) // 3, "big"))
+
+
+# Where every codon occurs in a gene, built in one pass: contains and count are O(1) and
+# positions is O(k) for the k occurrences of a codon
+class CodonIndex:
+    def __init__(self, codon_ids: array) -> None:
+        self.codon_ids: array = codon_ids
+        self._positions: List[array] = [array('L') for _ in range(CODON_COUNT)]
+        for position, codon_id in enumerate(codon_ids):
+            self._positions[codon_id].append(position)
+
+    def __len__(self) -> int:
+        return len(self.codon_ids)
+
+    def __contains__(self, codon: Codon) -> bool:
+        return self.contains(codon)
+
+    def contains(self, codon: Codon) -> bool:
+        return len(self._positions[codon_to_id(codon)]) > 0
+
+    def count(self, codon: Codon) -> int:
+        return len(self._positions[codon_to_id(codon)])
+
+    # codon positions within the gene, in increasing order
+    def positions(self, codon: Codon) -> array:
+        return self._positions[codon_to_id(codon)][:]
+
+
+# Sorted copy of a compact gene, by counting: O(n) instead of O(n log n) comparisons of tuples
+def sort_codon_ids(codon_ids: array) -> array:
+    counts: List[int] = [0] * CODON_COUNT
+    for codon_id in codon_ids:
+        counts[codon_id] += 1
+    return array('B', b"".join(bytes((codon_id,)) * count for codon_id, count in enumerate(counts)))
+
+
+def bisect_search(sorted_ids: array, key_codon: Codon) -> bool:
+    key: int = codon_to_id(key_codon)
+    index: int = bisect_left(sorted_ids, key)
+    return index < len(sorted_ids) and sorted_ids[index] == key
+
+
+def bisect_count(sorted_ids: array, key_codon: Codon) -> int:
+    key: int = codon_to_id(key_codon)
+    return bisect_right(sorted_ids, key) - bisect_left(sorted_ids, key)
+
+
 def linear_search(gene: Gene, key_codon: Codon):
     for codon in gene:
         if codon == key_codon: return True
@@ -37,6 +139,404 @@ def binary_search(sortedGene: Gene, key_codon: Codon) -> bool:
     return False
 
 
+# Motifs given as codons or genes, as a string of nucleotides
+def motif_to_string(motif: Motif) -> str:
+    if isinstance(motif, str):
+        return motif.upper()
+    if motif and isinstance(motif[0], tuple):  # a Gene
+        return "".join(n.name for codon in motif for n in codon)
+    return "".join(n.name for n in motif)
+
+
+# Aho-Corasick automaton matching any number of motifs in a single pass over the input. The trie
+# of the motifs is turned into a complete state machine over A, C, G, T (plus a break symbol that
+# always goes back to the root), so every input nucleotide costs one table lookup whatever the
+# number of motifs. The input is consumed chunk by chunk and the state carries over from one
+# chunk to the next, so motifs straddling a chunk boundary are found with no overlap or buffering,
+# and matches are yielded chunk by chunk, as soon as they are found.
+class MotifMatcher:
+    def __init__(self, motifs: Iterable[Motif]) -> None:
+        self.motifs: List[str] = [motif_to_string(motif) for motif in motifs]
+        # trie: children[state][code], -1 where there is no child yet; the root is state 0
+        children: List[List[int]] = [[-1] * 4]
+        found: List[List[int]] = [[]]  # motifs ending at each state
+        for index, motif in enumerate(self.motifs):
+            if not motif:
+                raise ValueError("Motifs must not be empty")
+            state: int = 0
+            for nucleotide in motif:
+                if nucleotide not in "ACGT":
+                    raise ValueError("Invalid Nucleotide: {}".format(nucleotide))
+                code: int = "ACGT".index(nucleotide)
+                if children[state][code] == -1:
+                    children[state][code] = len(children)
+                    children.append([-1] * 4)
+                    found.append([])
+                state = children[state][code]
+            found[state].append(index)
+
+        # breadth-first over the trie: every missing child becomes the transition of the longest
+        # proper suffix (the failure state), and a state also reports the motifs of that suffix
+        failure: List[int] = [0] * len(children)
+        queue: Deque[int] = deque()
+        for code in range(4):
+            if children[0][code] == -1:
+                children[0][code] = 0
+            else:
+                queue.append(children[0][code])
+        while queue:
+            state = queue.popleft()
+            found[state] += found[failure[state]]
+            for code in range(4):
+                child: int = children[state][code]
+                if child == -1:
+                    children[state][code] = children[failure[state]][code]
+                else:
+                    failure[child] = children[failure[state]][code]
+                    queue.append(child)
+
+        # flat transition table with 5 columns, states stored as their row offset
+        self._goto: array = array('l')
+        for row in children:
+            self._goto.extend(child * 5 for child in row)
+            self._goto.append(0)  # _BREAK
+        self._outputs: Dict[int, Tuple[Tuple[int, int], ...]] = {
+            state * 5: tuple((index, len(self.motifs[index])) for index in indexes)
+            for state, indexes in enumerate(found) if indexes}
+
+    # Run codes through the automaton from state, adding the matches to matches with positions
+    # relative to the start of codes; returns the state reached
+    def _advance(self, codes: bytes, state: int, matches: List[MotifMatch]) -> int:
+        goto: array = self._goto
+        outputs: Dict[int, Tuple[Tuple[int, int], ...]] = self._outputs
+        for offset, code in enumerate(codes):
+            state = goto[state + code]
+            if state in outputs:
+                for index, length in outputs[state]:
+                    matches.append((offset + 1 - length, index))
+        return state
+
+    @staticmethod
+    def _codes(chunk: str) -> bytes:
+        return chunk.encode("ascii", errors="replace").translate(_MATCH_CODES, _WHITESPACE)
+
+    # Matches in a sequence given as consecutive chunks of text (whitespace is ignored)
+    def scan(self, chunks: Iterable[str]) -> Iterator[MotifMatch]:
+        state: int = 0
+        position: int = 0  # of the start of the current chunk
+        for chunk in chunks:
+            codes: bytes = self._codes(chunk)
+            matches: List[MotifMatch] = []
+            state = self._advance(codes, state, matches)
+            for start, index in matches:
+                yield position + start, index
+            position += len(codes)
+
+    def scan_gene(self, gene: Gene) -> Iterator[MotifMatch]:
+        return self.scan(motif_to_string(codon) for codon in gene)
+
+    # Matches in every record of a FASTA file, read chunk_size characters at a time
+    def scan_fasta(self, file: TextIO, chunk_size: int = MATCH_CHUNK_SIZE) -> Iterator[FastaMatch]:
+        record: str = ""
+        header: List[str] = []  # parts of the header being read, possibly over several chunks
+        in_header: bool = False
+        line_start: bool = True
+        state: int = 0
+        position: int = 0  # within the record
+        while True:
+            chunk: str = file.read(chunk_size)
+            if not chunk:
+                return
+            lines: List[str] = chunk.split("\n")
+            for number, line in enumerate(lines):
+                if number > 0:
+                    line_start = True
+                if line_start and line.startswith(">"):
+                    in_header = True
+                    header = [line[1:]]
+                elif in_header:
+                    header.append(line)
+                elif line:
+                    codes: bytes = self._codes(line)
+                    matches: List[MotifMatch] = []
+                    state = self._advance(codes, state, matches)
+                    for start, index in matches:
+                        yield record, position + start, index
+                    position += len(codes)
+                if line:
+                    line_start = False
+                if in_header and number < len(lines) - 1:  # the header line is complete
+                    record = "".join(header).strip()
+                    in_header = False
+                    state = position = 0
+
+
+# Suffix array by induced sorting (SA-IS), in O(n) for a list of ints in [0, upper]. Suffixes are
+# classified as S (smaller than the next one) or L; the leftmost S of every run (LMS) is sorted by
+# one induction pass, the LMS substrings are named and, if two of them share a name, their order
+# is settled by a recursive call on the names before a last induction pass sorts every suffix.
+def _sa_is(s: List[int], upper: int) -> List[int]:
+    n: int = len(s)
+    if n < 2:
+        return list(range(n))
+    if n == 2:
+        return [0, 1] if s[0] < s[1] else [1, 0]
+
+    is_s: List[bool] = [False] * n
+    for i in range(n - 2, -1, -1):
+        is_s[i] = is_s[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+    # bucket bounds: sum_l[c] is where the L suffixes starting with c go, sum_s[c] the S ones
+    sum_l: List[int] = [0] * (upper + 1)
+    sum_s: List[int] = [0] * (upper + 1)
+    for i in range(n):
+        if is_s[i]:
+            sum_l[s[i] + 1] += 1  # an S suffix never starts with upper
+        else:
+            sum_s[s[i]] += 1
+    for c in range(upper + 1):
+        sum_s[c] += sum_l[c]
+        if c < upper:
+            sum_l[c + 1] += sum_s[c]
+
+    sa: List[int] = [-1] * n
+
+    def induce(lms: List[int]) -> None:
+        for i in range(n):
+            sa[i] = -1
+        bucket: List[int] = sum_s[:]
+        for d in lms:
+            sa[bucket[s[d]]] = d
+            bucket[s[d]] += 1
+        bucket = sum_l[:]
+        sa[bucket[s[n - 1]]] = n - 1
+        bucket[s[n - 1]] += 1
+        for i in range(n):
+            v: int = sa[i] - 1
+            if v >= 0 and not is_s[v]:
+                sa[bucket[s[v]]] = v
+                bucket[s[v]] += 1
+        bucket = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i] - 1
+            if v >= 0 and is_s[v]:
+                bucket[s[v] + 1] -= 1
+                sa[bucket[s[v] + 1]] = v
+
+    lms_map: List[int] = [-1] * (n + 1)
+    lms: List[int] = []
+    for i in range(1, n):
+        if not is_s[i - 1] and is_s[i]:
+            lms_map[i] = len(lms)
+            lms.append(i)
+    m: int = len(lms)
+    induce(lms)
+
+    if m:
+        sorted_lms: List[int] = [v for v in sa if lms_map[v] != -1]
+        names: List[int] = [0] * m
+        name: int = 0
+        for i in range(1, m):
+            left: int = sorted_lms[i - 1]
+            right: int = sorted_lms[i]
+            end_left: int = lms[lms_map[left] + 1] if lms_map[left] + 1 < m else n
+            end_right: int = lms[lms_map[right] + 1] if lms_map[right] + 1 < m else n
+            same: bool = end_left - left == end_right - right
+            if same:
+                while left < end_left and s[left] == s[right]:
+                    left += 1
+                    right += 1
+                same = left != n and s[left] == s[right]
+            if not same:
+                name += 1
+            names[lms_map[sorted_lms[i]]] = name
+        sorted_names: List[int] = _sa_is(names, name)
+        induce([lms[i] for i in sorted_names])
+    return sa
+
+
+def suffix_array(gene: Motif) -> List[int]:
+    text: bytes = _fm_text(motif_to_string(gene))
+    return _sa_is(list(text), 4)[1:]  # the sentinel's suffix comes first
+
+
+def _fm_text(gene: str) -> bytes:
+    raw: bytes = gene.encode("ascii", errors="replace")
+    if raw.translate(None, b"ACGT"):
+        invalid: str = next(n for n in gene if n not in "ACGT")
+        raise ValueError("Invalid Nucleotide: {}".format(invalid))
+    return raw.translate(_FM_CODES) + b"\0"
+
+
+# Substring index of a gene: its Burrows-Wheeler transform with occurrence counts checkpointed
+# every OCC_SAMPLE rows and the suffix array sampled every SA_SAMPLE text positions. count(pattern)
+# takes O(|pattern|) rank queries, each reading at most OCC_SAMPLE BWT bytes; locate(pattern)
+# adds at most SA_SAMPLE LF steps per occurrence. Build once, then save and load it.
+class FMIndex:
+    def __init__(self, gene: Motif) -> None:
+        text: bytes = _fm_text(motif_to_string(gene))
+        sa: List[int] = _sa_is(list(text), 4)
+        self.length: int = len(text) - 1
+        self.bwt: bytearray = bytearray(text[i - 1] for i in sa)  # text[-1] is the sentinel
+        self.marks: bytearray = bytearray(int(i % SA_SAMPLE == 0) for i in sa)
+        self.samples: array = array('Q', (i for i in sa if i % SA_SAMPLE == 0))
+        self._checkpoint()
+
+    # occurrence and mark counts before every OCC_SAMPLE-th row, and the first row of every code
+    def _checkpoint(self) -> None:
+        self._occ: List[array] = [array('Q') for _ in range(5)]
+        self._marks: array = array('Q')
+        counts: List[int] = [0] * 5
+        marks: int = 0
+        for start in range(0, len(self.bwt) + 1, OCC_SAMPLE):
+            for code in range(5):
+                self._occ[code].append(counts[code])
+            self._marks.append(marks)
+            block: bytearray = self.bwt[start:start + OCC_SAMPLE]
+            for code in range(5):
+                counts[code] += block.count(code)
+            marks += self.marks.count(1, start, start + OCC_SAMPLE)
+        self._first: List[int] = [0] * 5
+        for code in range(1, 5):
+            self._first[code] = self._first[code - 1] + counts[code - 1]
+
+    # occurrences of code in the BWT rows before row
+    def _rank(self, code: int, row: int) -> int:
+        block: int = row // OCC_SAMPLE
+        return self._occ[code][block] + self.bwt.count(code, block * OCC_SAMPLE, row)
+
+    # rows [low, high) of the suffixes starting with pattern, by backward search
+    def _rows(self, pattern: Motif) -> Tuple[int, int]:
+        low: int = 0
+        high: int = len(self.bwt)
+        for nucleotide in reversed(motif_to_string(pattern)):
+            if nucleotide not in "ACGT":
+                return 0, 0
+            code: int = "ACGT".index(nucleotide) + 1
+            low = self._first[code] + self._rank(code, low)
+            high = self._first[code] + self._rank(code, high)
+            if low >= high:
+                return 0, 0
+        return low, high
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, pattern: Motif) -> bool:
+        return self.count(pattern) > 0
+
+    def count(self, pattern: Motif) -> int:
+        low, high = self._rows(pattern)
+        return high - low
+
+    # start of every occurrence of pattern, in increasing order
+    def locate(self, pattern: Motif) -> List[int]:
+        low, high = self._rows(pattern)
+        positions: List[int] = []
+        for row in range(low, high):
+            steps: int = 0
+            while not self.marks[row]:  # walk back in the text (LF) until a sampled position
+                code: int = self.bwt[row]
+                row = self._first[code] + self._rank(code, row)
+                steps += 1
+            block: int = row // OCC_SAMPLE
+            sample: int = self._marks[block] + self.marks.count(1, block * OCC_SAMPLE, row)
+            positions.append(self.samples[sample] + steps)
+        positions.sort()
+        return positions
+
+    def save(self, path: str) -> None:
+        samples: array = array('Q', self.samples)
+        if sys.byteorder != "little":
+            samples.byteswap()
+        with open(path, "wb") as file:
+            file.write(_FM_HEADER.pack(FM_MAGIC, self.length, OCC_SAMPLE, SA_SAMPLE))
+            file.write(self.bwt)
+            file.write(self.marks)
+            file.write(samples.tobytes())
+
+    # Load a saved index; only the occurrence checkpoints are recomputed, in a linear pass
+    @classmethod
+    def load(cls, path: str) -> FMIndex:
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+
+        if len(data) < _FM_HEADER.size:
+            raise ValueError("Not an FM-index file: {}".format(path))
+        magic, length, occ_sample, sa_sample = _FM_HEADER.unpack_from(data)
+        rows: int = length + 1
+        samples_start: int = _FM_HEADER.size + 2 * rows
+        if magic != FM_MAGIC or (occ_sample, sa_sample) != (OCC_SAMPLE, SA_SAMPLE):
+            raise ValueError("Not an FM-index file: {}".format(path))
+        if len(data) != samples_start + 8 * (length // SA_SAMPLE + 1):
+            raise ValueError("Truncated FM-index file: {}".format(path))
+
+        index: FMIndex = cls.__new__(cls)  # skip building the suffix array
+        index.length = length
+        index.bwt = bytearray(data[_FM_HEADER.size:_FM_HEADER.size + rows])
+        index.marks = bytearray(data[_FM_HEADER.size + rows:samples_start])
+        index.samples = array('Q', data[samples_start:])
+        if sys.byteorder != "little":
+            index.samples.byteswap()
+        index._checkpoint()
+        return index
+
+
+# Compare the tuple based searches with the compact gene, its index and its bisect based search
+def benchmark() -> None:
+    import random
+    from time import perf_counter
+
+    random.seed(42)
+    gene_str: str = "".join(random.choice("ACGT") for _ in range(3 * 300_000))
+    keys: List[Codon] = [id_to_codon(random.randrange(CODON_COUNT)) for _ in range(200)]
+
+    def timed(label: str, work) -> None:
+        start: float = perf_counter()
+        work()
+        print("{:<34} {:.4f}s".format(label, perf_counter() - start))
+
+    gene: Gene = []
+    timed("string_to_gene", lambda: gene.extend(string_to_gene(gene_str)))
+    codon_ids: array = array('B')
+    timed("string_to_codon_ids", lambda: codon_ids.extend(string_to_codon_ids(gene_str)))
+    sorted_gene: Gene = []
+    timed("sorted(gene)", lambda: sorted_gene.extend(sorted(gene)))
+    sorted_ids: array = array('B')
+    timed("sort_codon_ids", lambda: sorted_ids.extend(sort_codon_ids(codon_ids)))
+    indexes: List[CodonIndex] = []
+    timed("CodonIndex", lambda: indexes.append(CodonIndex(codon_ids)))
+
+    searches = (
+        ("{} x linear_search".format(len(keys)), lambda key: linear_search(gene, key)),
+        ("{} x binary_search".format(len(keys)), lambda key: binary_search(sorted_gene, key)),
+        ("{} x bisect_search".format(len(keys)), lambda key: bisect_search(sorted_ids, key)),
+        ("{} x CodonIndex.contains".format(len(keys)), indexes[0].contains),
+        ("{} x CodonIndex.count".format(len(keys)), indexes[0].count),
+        ("{} x bisect_count".format(len(keys)), lambda key: bisect_count(sorted_ids, key)),
+    )
+    for label, search in searches:
+        timed(label, lambda: [search(key) for key in keys])
+
+    motifs: List[str] = ["".join(random.choice("ACGT") for _ in range(random.randint(8, 16)))
+                         for _ in range(2000)]
+    matchers: List[MotifMatcher] = []
+    timed("MotifMatcher, {} motifs".format(len(motifs)),
+          lambda: matchers.append(MotifMatcher(motifs)))
+    chunks: List[str] = [gene_str[i:i + MATCH_CHUNK_SIZE]
+                         for i in range(0, len(gene_str), MATCH_CHUNK_SIZE)]
+    timed("MotifMatcher.scan", lambda: sum(1 for _ in matchers[0].scan(chunks)))
+
+    text: str = gene_str[:300_000]
+    fm_indexes: List[FMIndex] = []
+    timed("FMIndex, {} nucleotides".format(len(text)), lambda: fm_indexes.append(FMIndex(text)))
+    patterns: List[str] = [text[i:i + 12] for i in random.sample(range(len(text) - 12), 1000)]
+    timed("{} x FMIndex.count".format(len(patterns)),
+          lambda: [fm_indexes[0].count(pattern) for pattern in patterns])
+    timed("{} x FMIndex.locate".format(len(patterns)),
+          lambda: [fm_indexes[0].locate(pattern) for pattern in patterns])
+    timed("{} x str.find".format(len(patterns)), lambda: [text.find(pattern) for pattern in patterns])
+
+
 if __name__ == "__main__":
     gene_str: str = "ACGTGGCTCTCTAACGTACGTACGTACGGGGTTTATATATACCCTAGGACTCCCTTT"
     my_gene: Gene = string_to_gene(gene_str)
@@ -50,3 +550,23 @@ if __name__ == "__main__":
 
     print("binary search: {} (should be True)".format(binary_search(my_sorted_gene, acg)))
     print("binary search: {} (should be False)".format(binary_search(my_sorted_gene, gat)))
+
+    codon_ids: array = string_to_codon_ids(gene_str)
+    index: CodonIndex = CodonIndex(codon_ids)
+    sorted_ids: array = sort_codon_ids(codon_ids)
+    print("codon index: {} (should be True)".format(acg in index))
+    print("codon index: {} (should be False)".format(gat in index))
+    print("codon index: ACG at {}, {} times".format(list(index.positions(acg)), index.count(acg)))
+    print("bisect search: {} (should be True)".format(bisect_search(sorted_ids, acg)))
+    print("bisect search: {} (should be False)".format(bisect_search(sorted_ids, gat)))
+
+    matcher: MotifMatcher = MotifMatcher(["ACGTACG", acg, [acg, gat], "TATA"])
+    chunks: List[str] = [gene_str[i:i + 8] for i in range(0, len(gene_str), 8)]
+    print("motif matches (position, motif): {}".format(list(matcher.scan(chunks))))
+
+    fm_index: FMIndex = FMIndex(gene_str)
+    print("FM-index: TACG {} times at {}".format(fm_index.count("TACG"), fm_index.locate("TACG")))
+
+    if "--benchmark" in sys.argv:
+        print()
+        benchmark()
@@ -1,8 +1,15 @@
+from __future__ import annotations
+from array import array
 from enum import Enum
-from typing import List, NamedTuple, Callable, Optional
+from heapq import heappush, heappop
+from typing import Iterator, List, NamedTuple, Callable, Optional, Tuple
 import random
 from math import sqrt
-from generic_search import dfs, bfs, a_star, node_to_path, Node
+import struct
+import sys
+from time import perf_counter
+from zlib import crc32
+from generic_search import dfs, bfs, a_star, node_to_path, Node, SearchStats
 
 
 class Cell(str, Enum):
@@ -13,11 +20,55 @@ class Cell(str, Enum):
     PATH = "*"
 
 
+CELLS: List[Cell] = list(Cell)  # cell id -> cell, cells are stored as their ids
+EMPTY_ID: int = CELLS.index(Cell.EMPTY)
+BLOCKED_ID: int = CELLS.index(Cell.BLOCKED)
+_CELL_CHARS: bytes = bytes.maketrans(
+    bytes(range(len(CELLS))), "".join(c.value for c in CELLS).encode())
+# cell id -> 1 for walls, 0 for anything that can be walked through (path marks included)
+_WALLS: bytes = bytes.maketrans(bytes(range(len(CELLS))),
+                                bytes(int(c == Cell.BLOCKED) for c in CELLS))
+
+# Landmark file format, all integers little-endian:
+#   header:     magic, rows, cols, number of landmarks, CRC-32 of the maze's walls
+#   landmarks:  flat index of every landmark (uint32 each)
+#   tables:     BFS distance from every landmark to every flat index, -1 if unreachable (int32)
+LANDMARK_MAGIC: bytes = b"ALT1"
+_LANDMARK_HEADER: struct.Struct = struct.Struct("<4sIIII")
+
+
 class MazeLocation(NamedTuple):
     row: int
     col: int
 
 
+# One row of the grid as seen through Maze.grid, reading and writing the underlying cell ids
+class _GridRow:
+    __slots__ = ('_cells', '_start', '_cols')
+
+    def __init__(self, cells: bytearray, start: int, cols: int) -> None:
+        self._cells: bytearray = cells
+        self._start: int = start
+        self._cols: int = cols
+
+    def _index(self, col: int) -> int:
+        if not -self._cols <= col < self._cols:
+            raise IndexError("column out of range")
+        return self._start + col % self._cols
+
+    def __getitem__(self, col: int) -> Cell:
+        return CELLS[self._cells[self._index(col)]]
+
+    def __setitem__(self, col: int, cell: Cell) -> None:
+        self._cells[self._index(col)] = CELLS.index(cell)
+
+    def __len__(self) -> int:
+        return self._cols
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter([CELLS[c] for c in self._cells[self._start:self._start + self._cols]])
+
+
 class Maze:
     def __init__(
         self,
@@ -32,49 +83,84 @@ class Maze:
         self.cols: int = cols
         self.start: MazeLocation = start
         self.goal: MazeLocation = goal
+        # The grid is stored as one flat bytearray of cell ids, row after row, surrounded by a
+        # border of blocked cells: the neighbors of index i are i - width, i + width, i - 1 and
+        # i + 1, with no bounds checks needed. Maze.grid gives the usual rows of Cells on top of it.
+        self.width: int = cols + 2
+        self.neighbor_offsets: Tuple[int, ...] = (self.width, -self.width, 1, -1)
         # fill the grid with empty cells and randomly populate it with blocked cells
-        self.grid: List[List[Cell]] = self._get_randomly_filled_grid(sparseness)
+        self.cells: bytearray = self._get_randomly_filled_cells(sparseness)
+        self._rows: List[_GridRow] = [_GridRow(self.cells, self.index_of(MazeLocation(row, 0)),
+                                               cols) for row in range(rows)]
 
-    def _get_randomly_filled_grid(self, sparseness: float) -> List[List[Cell]]:
-        grid: List[List[Cell]] = [[Cell.EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
+    def _get_randomly_filled_cells(self, sparseness: float) -> bytearray:
+        cells: bytearray = bytearray([BLOCKED_ID]) * (self.width * (self.rows + 2))
         for row in range(self.rows):
-            for col in range(self.cols):
-                if random.uniform(0, 1.0) < sparseness:
-                    grid[row][col] = Cell.BLOCKED
-        return grid
+            start: int = self.index_of(MazeLocation(row, 0))
+            cells[start:start + self.cols] = bytes(
+                BLOCKED_ID if random.uniform(0, 1.0) < sparseness else EMPTY_ID
+                for _ in range(self.cols))
+        return cells
+
+    @property
+    def grid(self) -> List[_GridRow]:
+        return self._rows
+
+    def index_of(self, ml: MazeLocation) -> int:
+        return (ml.row + 1) * self.width + ml.col + 1
+
+    def location_of(self, index: int) -> MazeLocation:
+        row, col = divmod(index, self.width)
+        return MazeLocation(row - 1, col - 1)
 
     def __str__(self) -> str:
         output: str = ""
-        for row in self.grid:
-            output += "".join([c.value for c in row]) + "\n"
+        for row in range(self.rows):
+            start: int = self.index_of(MazeLocation(row, 0))
+            output += self.cells[start:start + self.cols].translate(_CELL_CHARS).decode() + "\n"
         return output
 
     def goal_test(self, ml: MazeLocation) -> bool:
         return ml == self.goal
 
     def successors(self, ml: MazeLocation) -> List[MazeLocation]:
-        locations: List[MazeLocation] = []
-        if ml.row + 1 < self.rows and self.grid[ml.row + 1][ml.col] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row + 1, ml.col))
-        if ml.row - 1 >= 0 and self.grid[ml.row - 1][ml.col] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row - 1, ml.col))
-        if ml.col + 1 < self.cols and self.grid[ml.row][ml.col + 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.col + 1))
-        if ml.col - 1 >= 0 and self.grid[ml.row][ml.col - 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.col - 1))
+        index: int = self.index_of(ml)
+        cells: bytearray = self.cells
+        return [self.location_of(index + offset) for offset in self.neighbor_offsets
+                if cells[index + offset] != BLOCKED_ID]
+
+    # 8-connected successors: a diagonal step is allowed when both cells it cuts past are open
+    def diagonal_successors(self, ml: MazeLocation) -> List[MazeLocation]:
+        index: int = self.index_of(ml)
+        cells: bytearray = self.cells
+        locations: List[MazeLocation] = self.successors(ml)
+        for vertical in (self.width, -self.width):
+            for horizontal in (1, -1):
+                if (cells[index + vertical] != BLOCKED_ID and cells[index + horizontal] != BLOCKED_ID
+                        and cells[index + vertical + horizontal] != BLOCKED_ID):
+                    locations.append(self.location_of(index + vertical + horizontal))
         return locations
 
+    # successors over flat indices, for the grid specialized searches
+    def neighbors(self, index: int) -> List[int]:
+        cells: bytearray = self.cells
+        return [index + offset for offset in self.neighbor_offsets
+                if cells[index + offset] != BLOCKED_ID]
+
+    def _set(self, ml: MazeLocation, cell: Cell) -> None:
+        self.cells[self.index_of(ml)] = CELLS.index(cell)
+
     def mark(self, path: List[MazeLocation]):
         for maze_location in path:
-            self.grid[maze_location.row][maze_location.col] = Cell.PATH
-        self.grid[self.start.row][self.start.col] = Cell.START
-        self.grid[self.goal.row][self.goal.col] = Cell.GOAL
+            self._set(maze_location, Cell.PATH)
+        self._set(self.start, Cell.START)
+        self._set(self.goal, Cell.GOAL)
 
     def clear(self, path: List[MazeLocation]):
         for maze_location in path:
-            self.grid[maze_location.row][maze_location.col] = Cell.EMPTY
-        self.grid[self.start.row][self.start.col] = Cell.START
-        self.grid[self.goal.row][self.goal.col] = Cell.GOAL
+            self._set(maze_location, Cell.EMPTY)
+        self._set(self.start, Cell.START)
+        self._set(self.goal, Cell.GOAL)
 
 
 def euclidean_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
@@ -93,6 +179,447 @@ def manhattan_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
     return distance
 
 
+DIAGONAL_COST: float = sqrt(2)
+
+
+# Shortest distance when diagonal steps are allowed, for 8-connected searches
+def octile_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
+    def distance(ml: MazeLocation) -> float:
+        x_dist: int = abs(ml.col - goal.col)
+        y_dist: int = abs(ml.row - goal.row)
+        return max(x_dist, y_dist) + (DIAGONAL_COST - 1) * min(x_dist, y_dist)
+    return distance
+
+
+# Step cost for a_star over Maze.diagonal_successors
+def octile_cost(parent: MazeLocation, child: MazeLocation) -> float:
+    return DIAGONAL_COST if parent.row != child.row and parent.col != child.col else 1.0
+
+
+# Grid specialized searches: they run on flat cell indices with parent and distance kept in typed
+# arrays, and only build MazeLocations for the path they return (ready for Maze.mark).
+def _index_path(maze: Maze, parents: array, index: int) -> List[MazeLocation]:
+    path: List[MazeLocation] = []
+    while index != -1:
+        path.append(maze.location_of(index))
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+def grid_bfs(maze: Maze) -> Optional[List[MazeLocation]]:
+    start: int = maze.index_of(maze.start)
+    goal: int = maze.index_of(maze.goal)
+    cells: bytearray = maze.cells
+    offsets: Tuple[int, ...] = maze.neighbor_offsets
+    parents: array = array('l', [-1]) * len(cells)
+    visited: bytearray = bytearray(len(cells))
+    visited[start] = 1
+
+    frontier: List[int] = [start]  # the current layer, a plain list is enough
+    while frontier:
+        next_frontier: List[int] = []
+        for index in frontier:
+            if index == goal:
+                return _index_path(maze, parents, index)
+            for offset in offsets:
+                child: int = index + offset
+                if cells[child] != BLOCKED_ID and not visited[child]:
+                    visited[child] = 1
+                    parents[child] = index
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return None
+
+
+def grid_a_star(maze: Maze) -> Optional[List[MazeLocation]]:
+    start: int = maze.index_of(maze.start)
+    goal: int = maze.index_of(maze.goal)
+    goal_row, goal_col = divmod(goal, maze.width)
+    width: int = maze.width
+    cells: bytearray = maze.cells
+    offsets: Tuple[int, ...] = maze.neighbor_offsets
+    parents: array = array('l', [-1]) * len(cells)
+    distances: array = array('l', [-1]) * len(cells)  # -1 until reached
+    distances[start] = 0
+
+    def heuristic(index: int) -> int:  # Manhattan distance on flat indices
+        row, col = divmod(index, width)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    frontier: List[Tuple[int, int, int]] = [(heuristic(start), 0, start)]  # (f, g, index)
+    while frontier:
+        _, cost, index = heappop(frontier)
+        if cost > distances[index]:  # stale entry, a shorter path was found since
+            continue
+        if index == goal:
+            return _index_path(maze, parents, index)
+        for offset in offsets:
+            child: int = index + offset
+            if cells[child] != BLOCKED_ID and (distances[child] == -1
+                                                or distances[child] > cost + 1):
+                distances[child] = cost + 1
+                parents[child] = index
+                heappush(frontier, (cost + 1 + heuristic(child), cost + 1, child))
+    return None
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+# Jump Point Search: A* over jump points only. On open grids many equivalent shortest paths exist;
+# JPS keeps one canonical ordering of the moves and scans straight (and, 8-connected, diagonal)
+# lines from every expanded cell without queueing the cells it passes, stopping only at the goal
+# or at cells with a forced neighbor (one that can be reached optimally only through them). With
+# diagonal=False the maze's own 4-connected moves are used (horizontal scans are done from every
+# cell of a vertical scan); with diagonal=True the moves of Maze.diagonal_successors.
+# Returns the full cell-by-cell path, like the other solvers, so Maze.mark still works.
+def jump_point_search(
+    maze: Maze,
+    diagonal: bool = False,
+    stats: Optional[SearchStats] = None,
+) -> Optional[List[MazeLocation]]:
+    started: float = perf_counter() if stats is not None else 0.0
+    start: int = maze.index_of(maze.start)
+    goal: int = maze.index_of(maze.goal)
+    width: int = maze.width
+    goal_row, goal_col = divmod(goal, width)
+    cells: bytearray = maze.cells
+
+    # scan from index in the straight direction step, side being the perpendicular unit offset;
+    # returns the jump point found, or -1 when running into a wall
+    def jump_straight(index: int, step: int, side: int) -> int:
+        across: bool = not diagonal and side == 1  # 4-connected vertical scan
+        while cells[index] != BLOCKED_ID:
+            if index == goal:
+                return index
+            behind: int = index - step
+            if ((cells[index + side] != BLOCKED_ID and cells[behind + side] == BLOCKED_ID)
+                    or (cells[index - side] != BLOCKED_ID and cells[behind - side] == BLOCKED_ID)):
+                return index
+            if across and (jump_straight(index + 1, 1, width) != -1
+                           or jump_straight(index - 1, -1, width) != -1):
+                return index
+            index += step
+        return -1
+
+    def jump_diagonal(index: int, vertical: int, horizontal: int) -> int:
+        while cells[index] != BLOCKED_ID:
+            if index == goal:
+                return index
+            if (jump_straight(index + horizontal, horizontal, width) != -1
+                    or jump_straight(index + vertical, vertical, 1) != -1):
+                return index
+            if cells[index + horizontal] == BLOCKED_ID or cells[index + vertical] == BLOCKED_ID:
+                return -1
+            index += vertical + horizontal
+        return -1
+
+    # directions (vertical, horizontal) worth scanning from index, given how it was reached
+    def directions(index: int, parent: int) -> List[Tuple[int, int]]:
+        if parent == -1:
+            moves: List[Tuple[int, int]] = [(width, 0), (-width, 0), (0, 1), (0, -1)]
+            if diagonal:
+                moves += [(v, h) for v in (width, -width) for h in (1, -1)
+                          if cells[index + v] != BLOCKED_ID and cells[index + h] != BLOCKED_ID]
+            return moves
+        row, col = divmod(index, width)
+        parent_row, parent_col = divmod(parent, width)
+        vertical: int = width * _sign(row - parent_row)
+        horizontal: int = _sign(col - parent_col)
+        if not diagonal:  # everything but going back
+            if horizontal:
+                return [(0, horizontal), (width, 0), (-width, 0)]
+            return [(vertical, 0), (0, 1), (0, -1)]
+        if vertical and horizontal:
+            moves = [(vertical, 0), (0, horizontal)]
+            if cells[index + vertical] != BLOCKED_ID and cells[index + horizontal] != BLOCKED_ID:
+                moves.append((vertical, horizontal))
+            return moves
+        side: int = 1 if vertical else width
+        step: int = vertical or horizontal
+        moves = [(step, 0) if vertical else (0, step), (side, 0) if horizontal else (0, side),
+                 (-side, 0) if horizontal else (0, -side)]
+        if cells[index + step] != BLOCKED_ID:
+            moves += [(step, s) if vertical else (s, step) for s in (side, -side)
+                      if cells[index + s] != BLOCKED_ID]
+        return moves
+
+    def octile(a: int, b: int) -> float:
+        a_row, a_col = divmod(a, width)
+        b_row, b_col = divmod(b, width)
+        x_dist: int = abs(a_col - b_col)
+        y_dist: int = abs(a_row - b_row)
+        return max(x_dist, y_dist) + (DIAGONAL_COST - 1) * min(x_dist, y_dist)
+
+    def heuristic(index: int) -> float:
+        if diagonal:
+            return octile(index, goal)
+        row, col = divmod(index, width)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    parents: array = array('l', [-1]) * len(cells)
+    distances: array = array('d', [-1.0]) * len(cells)  # -1 until reached
+    distances[start] = 0.0
+    reached: int = 1
+    # (f, -g, index): among equal f, the deepest entry comes first, which keeps the search on one
+    # of the many equivalent paths of an open grid instead of widening over all of them
+    frontier: List[Tuple[float, float, int]] = [(heuristic(start), -0.0, start)]
+    while frontier:
+        _, cost, index = heappop(frontier)
+        cost = -cost
+        if cost > distances[index]:  # stale entry
+            continue
+        if index == goal:
+            jump_points: List[MazeLocation] = _index_path(maze, parents, index)
+            if stats is not None:
+                goal_node: Optional[Node[MazeLocation]] = None
+                for location in jump_points:
+                    goal_node = Node(location, goal_node, distances[maze.index_of(location)])
+                stats.finish(started, reached, goal_node)
+            return _fill_path(jump_points)
+
+        children: List[int] = []
+        for vertical, horizontal in directions(index, parents[index]):
+            if vertical and horizontal:
+                child: int = jump_diagonal(index + vertical + horizontal, vertical, horizontal)
+            elif horizontal:
+                child = jump_straight(index + horizontal, horizontal, width)
+            else:
+                child = jump_straight(index + vertical, vertical, 1)
+            if child == -1:
+                continue
+            children.append(child)
+            new_cost: float = cost + octile(index, child)
+            if distances[child] == -1.0:
+                reached += 1
+            elif distances[child] <= new_cost:
+                continue
+            distances[child] = new_cost
+            parents[child] = index
+            heappush(frontier, (new_cost + heuristic(child), -new_cost, child))
+        if stats is not None:
+            stats.expand(maze.location_of(index), [maze.location_of(c) for c in children])
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+
+    if stats is not None:
+        stats.finish(started, reached, None)
+    return None
+
+
+# Every cell along the straight or diagonal segments joining consecutive jump points
+def _fill_path(jump_points: List[MazeLocation]) -> List[MazeLocation]:
+    path: List[MazeLocation] = jump_points[:1]
+    for target in jump_points[1:]:
+        current: MazeLocation = path[-1]
+        row_step: int = _sign(target.row - current.row)
+        col_step: int = _sign(target.col - current.col)
+        while current != target:
+            current = MazeLocation(current.row + row_step, current.col + col_step)
+            path.append(current)
+    return path
+
+
+# Distance from source to every flat index of the maze, -1 where it cannot be reached
+def _bfs_distances(maze: Maze, source: int) -> array:
+    cells: bytearray = maze.cells
+    offsets: Tuple[int, ...] = maze.neighbor_offsets
+    distances: array = array('i', [-1]) * len(cells)
+    distances[source] = 0
+    frontier: List[int] = [source]
+    distance: int = 0
+    while frontier:
+        distance += 1
+        next_frontier: List[int] = []
+        for index in frontier:
+            for offset in offsets:
+                child: int = index + offset
+                if cells[child] != BLOCKED_ID and distances[child] == -1:
+                    distances[child] = distance
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+# Size of the area around source (open cells it reaches, which are flagged in reached) and its
+# cell farthest from source
+def _bfs_area(maze: Maze, source: int, reached: bytearray) -> Tuple[int, int]:
+    cells: bytearray = maze.cells
+    offsets: Tuple[int, ...] = maze.neighbor_offsets
+    reached[source] = 1
+    frontier: List[int] = [source]
+    size: int = 0
+    farthest: int = source
+    while frontier:
+        size += len(frontier)
+        farthest = frontier[-1]
+        next_frontier: List[int] = []
+        for index in frontier:
+            for offset in offsets:
+                child: int = index + offset
+                if cells[child] != BLOCKED_ID and not reached[child]:
+                    reached[child] = 1
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return size, farthest
+
+
+# ALT (A*, landmarks, triangle inequality) preprocessing for answering many queries on one maze.
+# A few landmark cells are picked far apart from each other and a full BFS is run from each, so
+# that d(n, goal) >= |d(L, goal) - d(L, n)| for every landmark L. Unlike manhattan_distance this
+# lower bound accounts for walls, and it stays admissible, so a_star still finds shortest paths
+# while expanding far fewer states. Build once per maze, then save and load it.
+class Landmarks:
+    def __init__(self, maze: Maze, count: int = 8, seed: Optional[MazeLocation] = None) -> None:
+        self.maze: Maze = maze
+        self.landmarks: List[int] = []  # flat indices
+        self.tables: List[array] = []  # one distance table per landmark
+        if count < 1:
+            return
+
+        # The open cells form separate areas wherever walls close them off. Landmarks are picked
+        # by farthest point selection: the next one is either the cell farthest from all the
+        # landmarks so far, or, when some area without landmark is larger than that distance,
+        # the cell farthest from where that area was first reached. The largest areas get
+        # landmarks first (the area of seed before any other, when given); cells of areas left
+        # without one fall back to manhattan_distance.
+        cells: bytearray = maze.cells
+        reached: bytearray = bytearray(len(cells))
+        areas: List[Tuple[int, int]] = []  # (size, farthest cell) of every area
+        if seed is not None:
+            if cells[maze.index_of(seed)] == BLOCKED_ID:
+                raise ValueError("Landmark seed {} is blocked".format(seed))
+            first_area: Tuple[int, int] = _bfs_area(maze, maze.index_of(seed), reached)
+        for index, cell in enumerate(cells):
+            if cell != BLOCKED_ID and not reached[index]:
+                areas.append(_bfs_area(maze, index, reached))
+        areas.sort(reverse=True)
+        if seed is not None:
+            areas.insert(0, first_area)
+
+        closest: array = array('i', [-1]) * len(cells)  # to the closest landmark, -1 if none
+        next_area: int = 0
+        for _ in range(count):
+            landmark: int = max(range(len(closest)), key=closest.__getitem__)
+            if next_area < len(areas) and areas[next_area][0] > closest[landmark]:
+                landmark = areas[next_area][1]
+                next_area += 1
+            elif closest[landmark] <= 0:
+                break  # every open cell is already a landmark
+            table: array = _bfs_distances(maze, landmark)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            for index, distance in enumerate(table):
+                if distance != -1 and (closest[index] == -1 or distance < closest[index]):
+                    closest[index] = distance
+
+    def _walls_checksum(self) -> int:
+        return crc32(self.maze.cells.translate(_WALLS))
+
+    def heuristic(self, goal: MazeLocation) -> Callable[[MazeLocation], float]:
+        goal_index: int = self.maze.index_of(goal)
+        # only landmarks reaching the goal give a bound; theirs are looked up once per goal
+        bounds: List[Tuple[array, int]] = [(table, table[goal_index]) for table in self.tables
+                                           if table[goal_index] != -1]
+        fallback: Callable[[MazeLocation], float] = manhattan_distance(goal)
+        width: int = self.maze.width
+
+        def distance(ml: MazeLocation) -> float:
+            index: int = (ml.row + 1) * width + ml.col + 1
+            best: float = fallback(ml)
+            for table, to_goal in bounds:
+                to_ml: int = table[index]
+                if to_ml != -1 and abs(to_goal - to_ml) > best:
+                    best = abs(to_goal - to_ml)
+            return best
+        return distance
+
+    def save(self, path: str) -> None:
+        tables: array = array('i')
+        for table in self.tables:
+            tables.extend(table)
+        landmarks: array = array('I', self.landmarks)
+        if sys.byteorder != "little":
+            tables.byteswap()
+            landmarks.byteswap()
+        with open(path, "wb") as file:
+            file.write(_LANDMARK_HEADER.pack(LANDMARK_MAGIC, self.maze.rows, self.maze.cols,
+                                             len(self.landmarks), self._walls_checksum()))
+            file.write(landmarks.tobytes())
+            file.write(tables.tobytes())
+
+    # Load landmarks saved for this maze; raises ValueError if the file was built for another one
+    @classmethod
+    def load(cls, path: str, maze: Maze) -> Landmarks:
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+
+        if len(data) < _LANDMARK_HEADER.size:
+            raise ValueError("Not a landmark file: {}".format(path))
+        magic, rows, cols, count, checksum = _LANDMARK_HEADER.unpack_from(data)
+        size: int = len(maze.cells)
+        body_start: int = _LANDMARK_HEADER.size + 4 * count
+        if magic != LANDMARK_MAGIC:
+            raise ValueError("Not a landmark file: {}".format(path))
+        landmarks: Landmarks = cls(maze, 0)  # skip the BFS passes
+        if (rows, cols) != (maze.rows, maze.cols) or checksum != landmarks._walls_checksum():
+            raise ValueError("Landmark file {} was built for another maze".format(path))
+        if len(data) != body_start + 4 * count * size:
+            raise ValueError("Truncated landmark file: {}".format(path))
+        indices: array = array('I', data[_LANDMARK_HEADER.size:body_start])
+        tables: array = array('i', data[body_start:])
+        if sys.byteorder != "little":
+            indices.byteswap()
+            tables.byteswap()
+        landmarks.landmarks = list(indices)
+        landmarks.tables = [tables[i * size:(i + 1) * size] for i in range(count)]
+        return landmarks
+
+
+# Expansions and time of plain A* against Jump Point Search on open mazes, 4 and 8-connected
+def benchmark() -> None:
+    random.seed(42)
+    for sparseness in (0.0, 0.01, 0.05, 0.2):
+        maze: Maze = Maze(300, 300, sparseness, MazeLocation(0, 0), MazeLocation(299, 299))
+        maze.cells[maze.index_of(maze.goal)] = CELLS.index(Cell.GOAL)  # never walled in
+        for diagonal in (False, True):
+            successors = maze.diagonal_successors if diagonal else maze.successors
+            heuristic = (octile_distance if diagonal else manhattan_distance)(maze.goal)
+            a_star_stats: SearchStats = SearchStats()
+            solution: Optional[Node[MazeLocation]] = a_star(
+                maze.start, maze.goal_test, successors, heuristic,
+                octile_cost if diagonal else None, a_star_stats)
+            jps_stats: SearchStats = SearchStats()
+            path: Optional[List[MazeLocation]] = jump_point_search(maze, diagonal, jps_stats)
+            same: bool = (solution is None) == (path is None)
+            if solution is not None and path is not None:
+                length: float = sum(octile_cost(a, b) for a, b in zip(path, path[1:]))
+                same = abs(length - solution.cost) < 1e-9
+            print("sparseness {:.2f}, {}-connected: A* {} expansions {:.3f}s, "
+                  "JPS {} expansions {:.3f}s, same cost: {}".format(
+                      sparseness, 8 if diagonal else 4, a_star_stats.expanded,
+                      a_star_stats.elapsed, jps_stats.expanded, jps_stats.elapsed, same))
+
+    # ALT against Manhattan distance, many queries on one maze whose walls matter
+    maze = Maze(200, 200, 0.3)
+    started: float = perf_counter()
+    landmarks: Landmarks = Landmarks(maze, 8)
+    print("8 landmarks built in {:.3f}s".format(perf_counter() - started))
+    # queries within the largest area (the first landmark's), so that they all have a solution
+    reachable: List[MazeLocation] = [maze.location_of(i)
+                                     for i, d in enumerate(landmarks.tables[0]) if d != -1]
+    expanded: List[int] = [0, 0]
+    for _ in range(100):
+        start, goal = random.sample(reachable, 2)
+        for i, heuristic in enumerate((manhattan_distance(goal), landmarks.heuristic(goal))):
+            stats: SearchStats = SearchStats()
+            a_star(start, lambda ml: ml == goal, maze.successors, heuristic, stats=stats)
+            expanded[i] += stats.expanded
+    print("100 queries: A* with Manhattan distance {} expansions, with landmarks {}".format(
+        *expanded))
+
+
 if __name__ == "__main__":
     search_algo_by_name = {
         'depth-first search': dfs,
@@ -123,3 +650,16 @@ if __name__ == "__main__":
             print("-> solved maze:")
             print(maze)
             maze.clear(path)
+
+    for name, grid_search in (('grid BFS', grid_bfs), ('grid A*', grid_a_star),
+                              ('Jump Point Search', jump_point_search)):
+        grid_path: Optional[List[MazeLocation]] = grid_search(maze)
+        if grid_path is None:
+            print("No solution found using {}!".format(name))
+        else:
+            print("=== Solution by {} ===".format(name))
+            print("-> path's length: {}".format(len(grid_path)))
+
+    if "--benchmark" in sys.argv:
+        print()
+        benchmark()
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from tkinter.tix import MAX
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from generic_search import bfs, Node, node_to_path
 
 
@@ -8,13 +11,30 @@ MAX_NUM: int = 3
 
 
 class MCState:
-    def __init__(self, missionaries: int, cannibals: int, boat: bool) -> None:
+    def __init__(
+        self,
+        missionaries: int,
+        cannibals: int,
+        boat: bool,
+        max_num: int = MAX_NUM,
+    ) -> None:
+        self.max_num: int = max_num  # missionaries, and cannibals, in total
         self.wm: int = missionaries  # west bank missionaries
         self.wc: int = cannibals  # west bank cannibals
-        self.em: int = MAX_NUM - self.wm  # east bank missionaries
-        self.ec: int = MAX_NUM - self.wc  # east bank cannibals
+        self.em: int = max_num - self.wm  # east bank missionaries
+        self.ec: int = max_num - self.wc  # east bank cannibals
         self.boat: bool = boat
 
+    # states are compared by value, so that bfs's explored set recognizes states seen before
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MCState):
+            return NotImplemented
+        return (self.wm, self.wc, self.boat, self.max_num) == \
+            (other.wm, other.wc, other.boat, other.max_num)
+
+    def __hash__(self) -> int:
+        return hash((self.wm, self.wc, self.boat, self.max_num))
+
     def __str__(self) -> str:
         return (
             '{} missionaries |{}| {} missionaries.\n'
@@ -25,7 +45,7 @@ class MCState:
         )
 
     def goal_test(self) -> bool:
-        return self.is_legal and self.em == MAX_NUM and self.ec == MAX_NUM
+        return self.is_legal and self.em == self.max_num and self.ec == self.max_num
 
     @property
     def is_legal(self) -> bool:
@@ -39,29 +59,182 @@ class MCState:
         sucs: List[MCState] = []
         if self.boat: # boat on west bank
             if self.wm > 1:
-                sucs.append(MCState(self.wm - 2, self.wc, not self.boat))
+                sucs.append(MCState(self.wm - 2, self.wc, not self.boat, self.max_num))
             if self.wm > 0:
-                sucs.append(MCState(self.wm - 1, self.wc, not self.boat))
+                sucs.append(MCState(self.wm - 1, self.wc, not self.boat, self.max_num))
             if self.wc > 1:
-                sucs.append(MCState(self.wm, self.wc - 2, not self.boat))
+                sucs.append(MCState(self.wm, self.wc - 2, not self.boat, self.max_num))
             if self.wc > 0:
-                sucs.append(MCState(self.wm, self.wc - 1, not self.boat))
+                sucs.append(MCState(self.wm, self.wc - 1, not self.boat, self.max_num))
             if (self.wc > 0) and (self.wm > 0):
-                sucs.append(MCState(self.wm - 1, self.wc - 1, not self.boat))
+                sucs.append(MCState(self.wm - 1, self.wc - 1, not self.boat, self.max_num))
         else: # boat on east bank
             if self.em > 1:
-                sucs.append(MCState(self.wm + 2, self.wc, not self.boat))
+                sucs.append(MCState(self.wm + 2, self.wc, not self.boat, self.max_num))
             if self.em > 0:
-                sucs.append(MCState(self.wm + 1, self.wc, not self.boat))
+                sucs.append(MCState(self.wm + 1, self.wc, not self.boat, self.max_num))
             if self.ec > 1:
-                sucs.append(MCState(self.wm, self.wc + 2, not self.boat))
+                sucs.append(MCState(self.wm, self.wc + 2, not self.boat, self.max_num))
             if self.ec > 0:
-                sucs.append(MCState(self.wm, self.wc + 1, not self.boat))
+                sucs.append(MCState(self.wm, self.wc + 1, not self.boat, self.max_num))
             if (self.ec > 0) and (self.em > 0):
-                sucs.append(MCState(self.wm + 1, self.wc + 1, not self.boat))
+                sucs.append(MCState(self.wm + 1, self.wc + 1, not self.boat, self.max_num))
         return [x for x in sucs if x.is_legal]
 
 
+# Legal boat loads (missionaries, cannibals) for a boat carrying up to capacity people: at least
+# one person rows, and missionaries are not outnumbered in the boat either
+@lru_cache(maxsize=None)
+def boat_moves(capacity: int) -> Tuple[Tuple[int, int], ...]:
+    return tuple((m, c) for m in range(capacity + 1) for c in range(capacity + 1 - m)
+                 if 0 < m + c and (m == 0 or m >= c))
+
+
+# Missionaries and cannibals with any number of each and any boat capacity. A state is a single
+# int, (west missionaries * (n + 1) + west cannibals) * 2 + boat on the west bank, and the boat
+# loads become precomputed int deltas, so bfs hashes and compares plain ints. Only states where
+# the west missionaries are 0, n or as many as the cannibals are legal, so there are O(n) of them
+# and the search scales to thousands of missionaries.
+class MCProblem:
+    def __init__(self, missionaries: int = MAX_NUM, capacity: int = 2) -> None:
+        if missionaries < 0 or capacity < 1:
+            raise ValueError("Need missionaries >= 0 and capacity >= 1: {}, {}".format(
+                missionaries, capacity))
+        self.missionaries: int = missionaries  # and as many cannibals
+        self.capacity: int = capacity
+        side: int = missionaries + 1
+        # (missionaries, cannibals, packed delta) of every boat load
+        self.moves: List[Tuple[int, int, int]] = [(m, c, (m * side + c) * 2 + 1)
+                                                  for m, c in boat_moves(capacity)]
+        self.start: int = self.pack(missionaries, missionaries, True)
+
+    def pack(self, wm: int, wc: int, boat: bool) -> int:
+        return (wm * (self.missionaries + 1) + wc) * 2 + boat
+
+    def unpack(self, state: int) -> Tuple[int, int, bool]:
+        people, boat = divmod(state, 2)
+        wm, wc = divmod(people, self.missionaries + 1)
+        return wm, wc, bool(boat)
+
+    def is_legal(self, wm: int, wc: int) -> bool:
+        return (wm == 0 or wm >= wc) and (wm == self.missionaries or wm <= wc)
+
+    def goal_test(self, state: int) -> bool:
+        return state < 2  # nobody left on the west bank, wherever the boat is
+
+    def successors(self, state: int) -> List[int]:
+        n: int = self.missionaries
+        wm, wc, boat = self.unpack(state)
+        sucs: List[int] = []
+        if boat:  # boat on west bank, loads leave it
+            for m, c, delta in self.moves:
+                if m <= wm and c <= wc and self.is_legal(wm - m, wc - c):
+                    sucs.append(state - delta)
+        else:  # boat on east bank, loads come back
+            for m, c, delta in self.moves:
+                if m <= n - wm and c <= n - wc and self.is_legal(wm + m, wc + c):
+                    sucs.append(state + delta)
+        return sucs
+
+    def to_mc_state(self, state: int) -> MCState:
+        wm, wc, boat = self.unpack(state)
+        return MCState(wm, wc, boat, self.missionaries)
+
+    # Fewest crossings solution as MCStates (ready for display_solution), or None
+    def solve(self) -> Optional[List[MCState]]:
+        solution: Optional[Node[int]] = bfs(self.start, self.goal_test, self.successors)
+        if solution is None:
+            return None
+        return [self.to_mc_state(state) for state in node_to_path(solution)]
+
+
+SweepResult = Dict[Tuple[int, int], Optional[int]]  # (missionaries, capacity) -> fewest crossings
+
+
+# Fewest crossings for every number of missionaries with one boat capacity, in a single
+# multi-source BFS: the start states of all the instances form the first layer and every layer
+# is expanded for all the unsolved instances at once, with states keyed by (missionaries, state)
+# and the capacity's boat move table shared by all of them. An instance is dropped as soon as it
+# reaches its goal; the ones whose states run out have no solution (None).
+def _sweep_capacity(capacity: int, missionaries: List[int]) -> List[Tuple[int, Optional[int]]]:
+    problems: Dict[int, MCProblem] = {n: MCProblem(n, capacity) for n in missionaries}
+    crossings: Dict[int, Optional[int]] = {n: None for n in problems}
+    frontier: List[Tuple[int, int]] = [(n, problem.start) for n, problem in problems.items()]
+    explored: Set[Tuple[int, int]] = set(frontier)
+    depth: int = 0
+    while frontier:
+        next_frontier: List[Tuple[int, int]] = []
+        for n, state in frontier:
+            if crossings[n] is not None:  # solved already
+                continue
+            problem: MCProblem = problems[n]
+            if problem.goal_test(state):
+                crossings[n] = depth
+                continue
+            for child in problem.successors(state):
+                if (n, child) not in explored:
+                    explored.add((n, child))
+                    next_frontier.append((n, child))
+        frontier = next_frontier
+        depth += 1
+    return [(n, crossings[n]) for n in missionaries]
+
+
+def _load_sweep_cache(path: str) -> SweepResult:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return {(n, capacity): crossings for n, capacity, crossings in json.load(file)}
+
+
+def _save_sweep_cache(path: str, results: SweepResult) -> None:
+    rows: List[List[Optional[int]]] = [[n, capacity, crossings]
+                                       for (n, capacity), crossings in sorted(results.items())]
+    temporary: str = path + ".tmp"
+    with open(temporary, "w") as file:
+        json.dump(rows, file)
+    os.replace(temporary, path)  # a crash never leaves a half written cache
+
+
+# Whether every (missionaries, capacity) pair of the grid can be solved, and in how few crossings.
+# Results are read from and added to cache_path (a JSON list of [n, capacity, crossings]) when it
+# is given, so only new pairs are computed. With workers > 1, every capacity's missionaries are
+# split in chunks swept by a process pool.
+def sweep(
+    missionaries: Iterable[int],
+    capacities: Iterable[int],
+    cache_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> SweepResult:
+    missionaries = list(missionaries)  # iterated once per capacity, so no generators
+    capacities = list(capacities)
+    pairs: List[Tuple[int, int]] = [(n, capacity) for capacity in capacities for n in missionaries]
+    results: SweepResult = _load_sweep_cache(cache_path) if cache_path is not None else {}
+
+    missing: Dict[int, List[int]] = {}
+    for n, capacity in pairs:
+        if (n, capacity) not in results:
+            missing.setdefault(capacity, []).append(n)
+    tasks: List[Tuple[int, List[int]]] = []
+    chunks: int = max(workers or 1, 1)
+    for capacity, ns in missing.items():
+        size: int = -(-len(ns) // chunks)  # ceiling division
+        tasks += [(capacity, ns[i:i + size]) for i in range(0, len(ns), size)]
+
+    if tasks and chunks > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            swept = list(pool.map(_sweep_capacity, *zip(*tasks)))
+    else:
+        swept = [_sweep_capacity(capacity, ns) for capacity, ns in tasks]
+    for (capacity, _), crossings in zip(tasks, swept):
+        for n, count in crossings:
+            results[n, capacity] = count
+
+    if cache_path is not None and tasks:
+        _save_sweep_cache(cache_path, results)
+    return {pair: results[pair] for pair in pairs}
+
+
 def display_solution(path: List[MCState]):
     if len(path) == 0:  # sanity check
         return
@@ -86,4 +259,26 @@ if __name__ == "__main__":
         print("No solution found!")
     else:
         path: List[MCState] = node_to_path(solution)
-        display_solution(path)
\ No newline at end of file
+        display_solution(path)
+
+    for missionaries, capacity in ((3, 2), (4, 2), (5, 3), (6, 3), (1000, 4), (5000, 5)):
+        mc_path: Optional[List[MCState]] = MCProblem(missionaries, capacity).solve()
+        print("{} missionaries, boat for {}: {}".format(
+            missionaries, capacity,
+            "no solution" if mc_path is None else "{} crossings".format(len(mc_path) - 1)))
+
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+
+    with TemporaryDirectory() as directory:  # the demo's cache is deleted afterwards
+        cache_path: str = os.path.join(directory, "missionaries_sweep.json")
+        for run in ("first", "cached"):
+            sweep_start: float = perf_counter()
+            report: SweepResult = sweep(range(1, 201), range(1, 7), cache_path, os.cpu_count())
+            print("{} sweep of {} (missionaries, capacity) pairs: {:.2f}s".format(
+                run, len(report), perf_counter() - sweep_start))
+    for capacity in range(1, 7):
+        solvable: List[int] = [n for n in range(1, 201) if report[n, capacity] is not None]
+        print("boat for {}: solvable for {} missionaries".format(
+            capacity, "all" if len(solvable) == 200 else
+            "up to {}".format(max(solvable)) if solvable else "no number of"))
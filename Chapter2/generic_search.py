@@ -1,7 +1,15 @@
 from __future__ import annotations
-from typing import TypeVar, Iterable, Sequence, Generic, List, Callable, Set, Deque, Dict, Any, Optional
+from typing import (
+    TypeVar, Iterable, Iterator, Sequence, Generic, List, Callable, Set, Deque, Dict, Any, Literal,
+    Optional, Tuple,
+)
 from typing_extensions import Protocol
 from heapq import heappush, heappop
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from os import cpu_count
+from time import perf_counter
 
 
 class Comparable(Protocol):
@@ -39,11 +47,16 @@ class Stack(Generic[T]):
     def pop(self) -> T:
         return self._container.pop()
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
 
 class Node(Generic[T]):
+    __slots__ = ('state', 'parent', 'cost', 'heuristic')
+
     def __init__(
         self,
         state: T,
@@ -74,6 +87,9 @@ class Queue(Generic[T]):
     def pop(self) -> T:
         return self._container.popleft()
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
@@ -92,10 +108,172 @@ class PriorityQueue(Generic[T]):
     def pop(self) -> T:
         return heappop(self._container)  # out by priority
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
 
+# Indexed d-ary min-heap: every item is in the queue at most once, with a position map that lets
+# its priority be lowered in place (decrease-key) instead of pushing a duplicate entry and
+# skipping stale ones later. Items must be hashable.
+class IndexedPriorityQueue(Generic[T]):
+    def __init__(self, arity: int = 4) -> None:
+        if arity < 2:
+            raise ValueError('A heap needs an arity of at least 2, got {}'.format(arity))
+        self._arity: int = arity
+        self._items: List[T] = []
+        self._priorities: List[float] = []
+        self._positions: Dict[T, int] = {}  # item -> index in the heap
+
+    @property
+    def empty(self) -> bool:
+        return not self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def priority(self, item: T) -> float:
+        return self._priorities[self._positions[item]]
+
+    def push(self, item: T, priority: float) -> None:
+        if item in self._positions:
+            raise KeyError('Item already in the queue: {!r}'.format(item))
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._positions[item] = len(self._items) - 1
+        self._sift_up(len(self._items) - 1)
+
+    def decrease_key(self, item: T, priority: float) -> None:
+        index: int = self._positions[item]
+        if priority > self._priorities[index]:
+            raise ValueError('New priority {} is higher than {}'.format(
+                priority, self._priorities[index]))
+        self._priorities[index] = priority
+        self._sift_up(index)
+
+    # push a new item, or lower the priority of a queued one; returns False if nothing changed
+    def push_or_decrease(self, item: T, priority: float) -> bool:
+        if item not in self._positions:
+            self.push(item, priority)
+        elif priority < self._priorities[self._positions[item]]:
+            self.decrease_key(item, priority)
+        else:
+            return False
+        return True
+
+    def peek(self) -> T:
+        if not self._items:
+            raise IndexError('peek from an empty priority queue')
+        return self._items[0]
+
+    def pop(self) -> T:
+        if not self._items:
+            raise IndexError('pop from an empty priority queue')
+        top: T = self._items[0]
+        last_item: T = self._items.pop()
+        last_priority: float = self._priorities.pop()
+        del self._positions[top]
+        if self._items:  # move the last leaf to the root and let it sink
+            self._items[0] = last_item
+            self._priorities[0] = last_priority
+            self._positions[last_item] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, index: int) -> None:
+        item: T = self._items[index]
+        priority: float = self._priorities[index]
+        while index > 0:
+            parent: int = (index - 1) // self._arity
+            if not priority < self._priorities[parent]:
+                break
+            self._move(parent, index)
+            index = parent
+        self._place(item, priority, index)
+
+    def _sift_down(self, index: int) -> None:
+        item: T = self._items[index]
+        priority: float = self._priorities[index]
+        size: int = len(self._items)
+        while True:
+            first: int = index * self._arity + 1
+            if first >= size:
+                break
+            last: int = min(first + self._arity, size)
+            child: int = min(range(first, last), key=self._priorities.__getitem__)
+            if not self._priorities[child] < priority:
+                break
+            self._move(child, index)
+            index = child
+        self._place(item, priority, index)
+
+    def _move(self, source: int, target: int) -> None:
+        self._items[target] = self._items[source]
+        self._priorities[target] = self._priorities[source]
+        self._positions[self._items[target]] = target
+
+    def _place(self, item: T, priority: float, index: int) -> None:
+        self._items[index] = item
+        self._priorities[index] = priority
+        self._positions[item] = index
+
+    def __repr__(self) -> str:
+        return repr(list(zip(self._items, self._priorities)))
+
+
+# Statistics filled in by dfs, bfs and a_star when passed as their stats argument, with optional
+# hooks called on every expansion (state), generated child (parent state, child) and on the goal
+# node. Searches called without stats only pay for a None check per expansion.
+@dataclass
+class SearchStats:
+    expanded: int = 0  # states whose successors were generated
+    generated: int = 0  # children returned by successors
+    reopened: int = 0  # already expanded states put back in the frontier through a cheaper path
+    peak_frontier: int = 0  # largest number of nodes waiting in the frontier
+    explored: int = 0  # states seen by the end of the search
+    elapsed: float = 0.0  # seconds spent in the search
+    on_expand: Optional[Callable[[Any], None]] = field(default=None, repr=False)
+    on_generate: Optional[Callable[[Any, Any], None]] = field(default=None, repr=False)
+    on_goal: Optional[Callable[[Node], None]] = field(default=None, repr=False)
+
+    @property
+    def time_per_expansion(self) -> float:
+        return self.elapsed / self.expanded if self.expanded else 0.0
+
+    def expand(self, state: Any, children: List[Any]) -> None:
+        self.expanded += 1
+        self.generated += len(children)
+        if self.on_expand is not None:
+            self.on_expand(state)
+        if self.on_generate is not None:
+            for child in children:
+                self.on_generate(state, child)
+
+    def finish(self, started: float, explored: int, goal: Optional[Node]) -> None:
+        self.elapsed += perf_counter() - started
+        self.explored = explored
+        if goal is not None and self.on_goal is not None:
+            self.on_goal(goal)
+
+
+# Run any search taking a stats argument and return its result together with the statistics
+def run_with_stats(
+    search: Callable[..., Optional[Node[T]]],
+    *args: Any,
+    on_expand: Optional[Callable[[Any], None]] = None,
+    on_generate: Optional[Callable[[Any, Any], None]] = None,
+    on_goal: Optional[Callable[[Node], None]] = None,
+    **kwargs: Any,
+) -> Tuple[Optional[Node[T]], SearchStats]:
+    stats: SearchStats = SearchStats(on_expand=on_expand, on_generate=on_generate, on_goal=on_goal)
+    return search(*args, stats=stats, **kwargs), stats
+
+
 def linear_search(iterable: Iterable[T], key: T) -> bool:
     for item in iterable:
         if item == key:
@@ -133,7 +311,9 @@ def dfs(
     initial: T,
     goal_test: Callable[[T], bool],
     successors: Callable[[T], List[T]],
+    stats: Optional[SearchStats] = None,
 ) -> Optional[Node[T]]:
+    started: float = perf_counter() if stats is not None else 0.0
     # frontier is where we have yet to go
     frontier: Stack[Node[T]] = Stack()
     frontier.push(Node(initial, None))
@@ -148,14 +328,23 @@ def dfs(
 
         # if we found the goal, we're done
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(started, len(explored), current_node)
             return current_node
 
         # check where we can go next and haven't explored
-        for child in successors(current_state):
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.expand(current_state, children)
+        for child in children:
             if child in explored:  # skip children we already explored
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
+        if stats is not None:
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+    if stats is not None:
+        stats.finish(started, len(explored), None)
     return None  # went through everything and never found goal
 
 
@@ -163,7 +352,9 @@ def bfs(
     initial: T,
     goal_test: Callable[[T], bool],
     successors: Callable[[T], List[T]],
+    stats: Optional[SearchStats] = None,
 ) -> Optional[Node[T]]:
+    started: float = perf_counter() if stats is not None else 0.0
     # frontier is where we have yet to go
     frontier: Queue[Node[T]] = Queue()
     frontier.push(Node(initial, None))
@@ -178,14 +369,23 @@ def bfs(
 
         # if we found the goal, we're done
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(started, len(explored), current_node)
             return current_node
 
         # check where we can go next and haven't explored
-        for child in successors(current_state):
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.expand(current_state, children)
+        for child in children:
             if child in explored:  # skip children we already explored
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
+        if stats is not None:
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+    if stats is not None:
+        stats.finish(started, len(explored), None)
     return None  # went through everything and never found goal
 
 
@@ -194,35 +394,484 @@ def a_star(
     goal_test: Callable[[T], bool],
     successors: Callable[[T], List[T]],
     heuristic: Callable[[T], float],
+    cost: Optional[Callable[[T, T], float]] = None,
+    stats: Optional[SearchStats] = None,
 ) -> Optional[Node[T]]:
-    # frontier is where we have yet to go
-    frontier: PriorityQueue[Node[T]] = PriorityQueue()
-    frontier.push(Node(initial, None, 0.0, heuristic(initial)))
+    started: float = perf_counter() if stats is not None else 0.0
+    # cost(parent, child) is the cost of a single step, 1 by default (which assumes a grid)
+    # frontier is where we have yet to go, keyed by state with cost + heuristic as priority:
+    # a cheaper path to a queued state lowers its priority in place instead of adding a duplicate
+    frontier: IndexedPriorityQueue[T] = IndexedPriorityQueue()
+    frontier.push(initial, heuristic(initial))
 
-    # explored is where we have been
-    explored: Dict[T, float] = {initial: 0.0}
+    # explored is where we have been, with the best node found for every state
+    explored: Dict[T, Node[T]] = {initial: Node(initial, None, 0.0, heuristic(initial))}
 
     # keep going while there is more to explore
     while not frontier.empty:
-        current_node: Node[T] = frontier.pop()
-        current_state: T = current_node.state
+        current_state: T = frontier.pop()
+        current_node: Node[T] = explored[current_state]
 
         # if we found the goal, we're done
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(started, len(explored), current_node)
             return current_node
 
         # check where we can go next and haven't explored
-        for child in successors(current_state):
-            # 1 assumes a grid, need a cost function for more sophisticated apps
-            new_cost: float = current_node.cost + 1
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.expand(current_state, children)
+        for child in children:
+            step: float = 1 if cost is None else cost(current_state, child)
+            new_cost: float = current_node.cost + step
+
+            if child not in explored:
+                explored[child] = Node(child, current_node, new_cost, heuristic(child))
+            elif explored[child].cost > new_cost:
+                # a state already seen but out of the frontier was expanded with a higher cost
+                # (inconsistent heuristic): it must be expanded again with the cheaper one
+                if stats is not None and child not in frontier:
+                    stats.reopened += 1
+                explored[child] = Node(child, current_node, new_cost, explored[child].heuristic)
+            else:
+                continue
+            frontier.push_or_decrease(child, new_cost + explored[child].heuristic)
+        if stats is not None:
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+
+    if stats is not None:
+        stats.finish(started, len(explored), None)
+    return None  # went through everything and never found goal
 
-            if child not in explored or explored[child] > new_cost:
-                explored[child] = new_cost
-                frontier.push(Node(child, current_node, new_cost, heuristic(child)))
 
+# Level-synchronous parallel BFS. Each layer of the frontier is cut into chunks whose successors
+# are generated by a process pool; the coordinating process then deduplicates the children against
+# the explored set and forms the next layer. Layers smaller than min_parallel_layer are expanded
+# in-process, so small searches never pay for the pool.
+# This only helps when successors is expensive: every state and its children are pickled on the
+# way to and from the workers, so the pool must save more than that per state (roughly tens of
+# microseconds or more). For cheap successors such as Maze.successors plain bfs is several times
+# faster, which is why the default keeps the pool for very wide layers only.
+# successors must be picklable (a module-level function or a method of a picklable object); it is
+# sent once to every worker when the pool starts, so chunks only carry states.
+_worker_successors: Optional[Callable[[Any], List[Any]]] = None
+
+
+def _set_worker_successors(successors: Callable[[T], List[T]]) -> None:
+    global _worker_successors
+    _worker_successors = successors
+
+
+def _expand_states(states: List[T]) -> List[List[T]]:
+    return [_worker_successors(state) for state in states]  # type: ignore
+
+
+def parallel_bfs(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+    workers: Optional[int] = None,
+    min_parallel_layer: int = 16384,
+) -> Optional[Node[T]]:
+    workers = workers or cpu_count() or 1
+    root: Node[T] = Node(initial, None)
+    if goal_test(initial):
+        return root
+
+    # explored is where we have been
+    explored: Set[T] = {initial}
+    layer: List[Node[T]] = [root]
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        while layer:
+            states: List[T] = [node.state for node in layer]
+            if len(layer) < min_parallel_layer:
+                children: List[List[T]] = [successors(state) for state in states]
+            else:
+                if pool is None:
+                    pool = ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_set_worker_successors,
+                        initargs=(successors,),
+                    )
+                size: int = -(-len(states) // (4 * workers))  # about 4 chunks per worker
+                chunks: List[List[T]] = [
+                    states[start:start + size] for start in range(0, len(states), size)]
+                children = [
+                    child_list
+                    for chunk_children in pool.map(_expand_states, chunks)
+                    for child_list in chunk_children
+                ]
+
+            next_layer: List[Node[T]] = []
+            for parent, child_list in zip(layer, children):
+                for child in child_list:
+                    if child in explored:  # skip children we already explored
+                        continue
+                    explored.add(child)
+                    child_node: Node[T] = Node(child, parent, parent.cost + 1)
+                    if goal_test(child):
+                        return child_node
+                    next_layer.append(child_node)
+            layer = next_layer
+    finally:
+        if pool is not None:
+            pool.shutdown()
     return None  # went through everything and never found goal
 
 
+# Bidirectional searches run one search forward from initial with successors and one backward
+# from goal with predecessors, and stop once they meet in the middle. In the backward search the
+# parent of a node is the next state on the way to the goal; _join_paths turns both halves back
+# into a single Node chain from initial to goal.
+def _join_paths(forward: Node[T], backward: Node[T]) -> Node[T]:
+    node: Node[T] = forward  # forward ends and backward starts at the meeting state
+    while backward.parent is not None:
+        step: float = backward.cost - backward.parent.cost
+        backward = backward.parent
+        node = Node(backward.state, node, node.cost + step)
+    return node
+
+
+# Expand a whole BFS layer of one side; returns the next layer and the meeting state with the
+# shortest total path, if the layer reached states already seen by the other side.
+def _expand_layer(
+    layer: List[T],
+    visited: Dict[T, Node[T]],
+    other_visited: Dict[T, Node[T]],
+    neighbors: Callable[[T], List[T]],
+) -> Tuple[List[T], Optional[T]]:
+    next_layer: List[T] = []
+    meeting: Optional[T] = None
+    best: float = float('inf')
+    for state in layer:
+        current_node: Node[T] = visited[state]
+        for child in neighbors(state):
+            if child in visited:
+                continue
+            visited[child] = Node(child, current_node, current_node.cost + 1)
+            next_layer.append(child)
+            if child in other_visited and visited[child].cost + other_visited[child].cost < best:
+                best = visited[child].cost + other_visited[child].cost
+                meeting = child
+    return next_layer, meeting
+
+
+def bidirectional_bfs(
+    initial: T,
+    goal: T,
+    successors: Callable[[T], List[T]],
+    predecessors: Callable[[T], List[T]],
+) -> Optional[Node[T]]:
+    forward: Dict[T, Node[T]] = {initial: Node(initial, None)}
+    backward: Dict[T, Node[T]] = {goal: Node(goal, None)}
+    if initial == goal:
+        return forward[initial]
+
+    forward_layer: List[T] = [initial]
+    backward_layer: List[T] = [goal]
+    meeting: Optional[T] = None
+    # always grow the smaller frontier, a whole layer at a time so the first meeting is the best
+    while forward_layer and backward_layer and meeting is None:
+        if len(forward_layer) <= len(backward_layer):
+            forward_layer, meeting = _expand_layer(forward_layer, forward, backward, successors)
+        else:
+            backward_layer, meeting = _expand_layer(backward_layer, backward, forward, predecessors)
+    if meeting is None:
+        return None  # one side ran out of states without meeting the other
+    return _join_paths(forward[meeting], backward[meeting])
+
+
+# heuristic estimates the cost to goal and reverse_heuristic the cost to initial. Both must be
+# consistent: the search stops as soon as the cheapest frontier entry of either side cannot lead
+# to a path cheaper than the best meeting found so far.
+def bidirectional_a_star(
+    initial: T,
+    goal: T,
+    successors: Callable[[T], List[T]],
+    predecessors: Callable[[T], List[T]],
+    heuristic: Callable[[T], float],
+    reverse_heuristic: Callable[[T], float],
+    cost: Optional[Callable[[T, T], float]] = None,
+) -> Optional[Node[T]]:
+    forward: Dict[T, Node[T]] = {initial: Node(initial, None, 0.0, heuristic(initial))}
+    backward: Dict[T, Node[T]] = {goal: Node(goal, None, 0.0, reverse_heuristic(goal))}
+    forward_frontier: IndexedPriorityQueue[T] = IndexedPriorityQueue()
+    forward_frontier.push(initial, forward[initial].heuristic)
+    backward_frontier: IndexedPriorityQueue[T] = IndexedPriorityQueue()
+    backward_frontier.push(goal, backward[goal].heuristic)
+
+    best: float = 0.0 if initial == goal else float('inf')  # cost of the best meeting so far
+    meeting: Optional[T] = initial if initial == goal else None
+
+    while not forward_frontier.empty and not backward_frontier.empty:
+        if (forward_frontier.priority(forward_frontier.peek()) >= best
+                or backward_frontier.priority(backward_frontier.peek()) >= best):
+            break  # nothing left in one of the frontiers can beat the best meeting
+
+        # grow the smaller frontier
+        is_forward: bool = len(forward_frontier) <= len(backward_frontier)
+        frontier, visited, other_visited = (
+            (forward_frontier, forward, backward) if is_forward
+            else (backward_frontier, backward, forward))
+        neighbors: Callable[[T], List[T]] = successors if is_forward else predecessors
+        estimate: Callable[[T], float] = heuristic if is_forward else reverse_heuristic
+
+        current_state: T = frontier.pop()
+        current_node: Node[T] = visited[current_state]
+        for child in neighbors(current_state):
+            step: float = 1
+            if cost is not None:  # the backward search walks the edges from child to current
+                step = cost(current_state, child) if is_forward else cost(child, current_state)
+            new_cost: float = current_node.cost + step
+            if child in visited and visited[child].cost <= new_cost:
+                continue
+            child_heuristic: float = (
+                visited[child].heuristic if child in visited else estimate(child))
+            visited[child] = Node(child, current_node, new_cost, child_heuristic)
+            frontier.push_or_decrease(child, new_cost + child_heuristic)
+            if child in other_visited and new_cost + other_visited[child].cost < best:
+                best = new_cost + other_visited[child].cost
+                meeting = child
+
+    if meeting is None:
+        return None
+    return _join_paths(forward[meeting], backward[meeting])
+
+
+# Compact search mode: instead of one Node per visited state, every state gets an integer id and
+# its parent id and cost are kept in parallel typed arrays. Only the solution path is turned back
+# into Node objects, so the result works with node_to_path like the one of the plain searches.
+class SearchTree(Generic[T]):
+    __slots__ = ('states', 'ids', 'parents', 'costs')
+
+    def __init__(self) -> None:
+        self.states: List[T] = []  # id -> state
+        self.ids: Dict[T, int] = {}  # state -> id, doubles as the explored set
+        self.parents: array = array('q')  # id -> parent id, -1 for the root
+        self.costs: array = array('d')  # id -> cost from the root
+
+    def add(self, state: T, parent: int, cost: float = 0.0) -> int:
+        index: int = len(self.states)
+        self.states.append(state)
+        self.ids[state] = index
+        self.parents.append(parent)
+        self.costs.append(cost)
+        return index
+
+    def path(self, index: int) -> List[T]:
+        path: List[T] = []
+        while index != -1:  # work backwards from end to front
+            path.append(self.states[index])
+            index = self.parents[index]
+        path.reverse()
+        return path
+
+    def to_node(self, index: int) -> Node[T]:
+        node: Optional[Node[T]] = None
+        for state in self.path(index):
+            node = Node(state, node, self.costs[self.ids[state]])
+        return node  # type: ignore
+
+
+def dfs_compact(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+) -> Optional[Node[T]]:
+    tree: SearchTree[T] = SearchTree()
+    frontier: List[int] = [tree.add(initial, -1)]  # stack of state ids
+
+    while frontier:
+        current: int = frontier.pop()
+        current_state: T = tree.states[current]
+        if goal_test(current_state):
+            return tree.to_node(current)
+        for child in successors(current_state):
+            if child not in tree.ids:
+                frontier.append(tree.add(child, current, tree.costs[current] + 1))
+    return None
+
+
+def bfs_compact(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+) -> Optional[Node[T]]:
+    tree: SearchTree[T] = SearchTree()
+    tree.add(initial, -1)
+
+    # ids are handed out in visiting order, so the frontier is just a moving index into the tree
+    current: int = 0
+    while current < len(tree.states):
+        current_state: T = tree.states[current]
+        if goal_test(current_state):
+            return tree.to_node(current)
+        for child in successors(current_state):
+            if child not in tree.ids:
+                tree.add(child, current, tree.costs[current] + 1)
+        current += 1
+    return None
+
+
+def a_star_compact(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+    heuristic: Callable[[T], float],
+    cost: Optional[Callable[[T, T], float]] = None,
+) -> Optional[Node[T]]:
+    tree: SearchTree[T] = SearchTree()
+    frontier: IndexedPriorityQueue[int] = IndexedPriorityQueue()  # keyed by state id
+    frontier.push(tree.add(initial, -1), heuristic(initial))
+
+    while not frontier.empty:
+        current: int = frontier.pop()
+        current_state: T = tree.states[current]
+        if goal_test(current_state):
+            return tree.to_node(current)
+
+        for child in successors(current_state):
+            step: float = 1 if cost is None else cost(current_state, child)  # like a_star
+            new_cost: float = tree.costs[current] + step
+            child_id: Optional[int] = tree.ids.get(child)
+            if child_id is None:
+                child_id = tree.add(child, current, new_cost)
+            elif tree.costs[child_id] > new_cost:
+                tree.parents[child_id] = current
+                tree.costs[child_id] = new_cost
+            else:
+                continue
+            frontier.push_or_decrease(child_id, new_cost + heuristic(child))
+    return None
+
+
+# Fixed-size transposition table for the memory-bounded searches: one slot per hash bucket
+# remembering the cheapest cost at which a state was reached. When two states collide, the
+# "always" policy keeps the newest one and the "shallowest" policy the one closest to the root,
+# whose pruning saves the biggest subtrees.
+class TranspositionTable(Generic[T]):
+    def __init__(
+        self,
+        capacity: int,
+        policy: Literal['always', 'shallowest'] = 'always',
+    ) -> None:
+        if capacity < 1:
+            raise ValueError('A transposition table needs at least one slot')
+        self.capacity: int = capacity
+        self.policy: str = policy
+        self._states: List[Any] = [_EMPTY_SLOT] * capacity
+        self._costs: array = array('d', [float('inf')]) * capacity
+
+    def clear(self) -> None:
+        self._states = [_EMPTY_SLOT] * self.capacity
+        self._costs = array('d', [float('inf')]) * self.capacity
+
+    # True when state was already reached at cost or cheaper, so its subtree can be skipped;
+    # otherwise the state is recorded (subject to the replacement policy).
+    def seen(self, state: T, cost: float) -> bool:
+        slot: int = hash(state) % self.capacity
+        if self._states[slot] == state:
+            if self._costs[slot] <= cost:
+                return True
+            self._costs[slot] = cost
+        elif (self.policy == 'always' or self._states[slot] is _EMPTY_SLOT
+                or cost <= self._costs[slot]):
+            self._states[slot] = state
+            self._costs[slot] = cost
+        return False
+
+
+_EMPTY_SLOT: Any = object()  # marks unused transposition table slots (states may be None)
+
+
+# One depth-first pass of IDA*: explores every path whose cost + heuristic stays within
+# threshold, keeping only the current path (and its pending children) in memory. Returns the goal
+# node if found, and the smallest cost + heuristic that exceeded the threshold otherwise.
+def _bounded_dfs(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+    heuristic: Callable[[T], float],
+    cost: Optional[Callable[[T, T], float]],
+    threshold: float,
+    table: Optional[TranspositionTable[T]],
+) -> Tuple[Optional[Node[T]], float]:
+    root: Node[T] = Node(initial, None, 0.0, heuristic(initial))
+    if root.heuristic > threshold:
+        return None, root.heuristic
+    if goal_test(initial):
+        return root, threshold
+    if table is not None:
+        table.clear()
+        table.seen(initial, 0.0)
+
+    next_threshold: float = float('inf')
+    on_path: Set[T] = {initial}  # states of the current path, to avoid cycles
+    stack: List[Tuple[Node[T], Iterator[T]]] = [(root, iter(successors(initial)))]
+    while stack:
+        current_node, children = stack[-1]
+        child: Any = next(children, _EMPTY_SLOT)
+        if child is _EMPTY_SLOT:  # every child explored, backtrack
+            stack.pop()
+            on_path.discard(current_node.state)
+            continue
+        if child in on_path:
+            continue
+
+        step: float = 1 if cost is None else cost(current_node.state, child)
+        new_cost: float = current_node.cost + step
+        if table is not None and table.seen(child, new_cost):
+            continue
+        child_heuristic: float = heuristic(child)
+        if new_cost + child_heuristic > threshold:
+            next_threshold = min(next_threshold, new_cost + child_heuristic)
+            continue
+
+        child_node: Node[T] = Node(child, current_node, new_cost, child_heuristic)
+        if goal_test(child):
+            return child_node, threshold
+        on_path.add(child)
+        stack.append((child_node, iter(successors(child))))
+    return None, next_threshold
+
+
+def ida_star(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+    heuristic: Callable[[T], float],
+    cost: Optional[Callable[[T, T], float]] = None,
+    table: Optional[TranspositionTable[T]] = None,
+) -> Optional[Node[T]]:
+    threshold: float = heuristic(initial)
+    while threshold != float('inf'):
+        solution, threshold = _bounded_dfs(
+            initial, goal_test, successors, heuristic, cost, threshold, table)
+        if solution is not None:
+            return solution
+    return None  # every path was explored and never found goal
+
+
+# Iterative deepening DFS: depth-limited DFS passes with a growing limit, finding a shortest path
+# like bfs with memory proportional to the depth only. It is IDA* with unit costs and no heuristic.
+def iddfs(
+    initial: T,
+    goal_test: Callable[[T], bool],
+    successors: Callable[[T], List[T]],
+    max_depth: Optional[int] = None,
+    table: Optional[TranspositionTable[T]] = None,
+) -> Optional[Node[T]]:
+    depth: float = 0
+    while depth != float('inf') and (max_depth is None or depth <= max_depth):
+        solution, depth = _bounded_dfs(
+            initial, goal_test, successors, lambda _: 0.0, None, depth, table)
+        if solution is not None:
+            return solution
+    return None
+
+
 if __name__ == '__main__':
     print(linear_search([1, 5, 15, 15, 15, 15, 20], 5))  # True
     print(binary_search(['a', 'd', 'e', 'f', 'z'], 'f'))  # True
@@ -1,38 +1,26 @@
 from __future__ import annotations
 from typing import Dict, List, Optional, Tuple, TypeVar
-from dataclasses import dataclass
 from mst import WeightedPath, print_weighted_path
 from weighted_graph import WeightedGraph
 from weighted_edge import WeightedEdge
-from priority_queue import PriorityQueue
+from priority_queue import IndexedPriorityQueue
 
 
 V = TypeVar('V')  # type of the vertices in the graph
 
 
-@dataclass
-class DijkstraNode:
-    vertex: int
-    distance: float
-
-    def __lt__(self, other: DijkstraNode) -> bool:
-        return self.distance < other.distance
-
-    def __eq__(self, other: DijkstraNode) -> bool:
-        return self.distance == other.distance
-
-
 def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
     first:int = wg.index_of(root)  # find starting index
     distances: List[Optional[float]] = [None] * wg.vertex_count  # distances are unknown at first
     path_dict: Dict[int, WeightedEdge] = {}  # how we got to each vertex
-    pq: PriorityQueue[DijkstraNode] = PriorityQueue()
+    # vertex indices keyed by distance, each vertex queued at most once
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
 
     distances[first] = 0  # the root is 0 away from the root
-    pq.push(DijkstraNode(first, 0))
+    pq.push(first, 0)
 
     while not pq.is_empty:
-        u: int = pq.pop().vertex  # explore the next closest vertex
+        u: int = pq.pop()  # explore the next closest vertex
         dist_u: float = distances[u]  # should already have seen it
         # look at every edge/vertex from the vertex in question
         for we in wg.edges_for_index(u):
@@ -41,7 +29,7 @@ def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict
             if dist_v is None or dist_v > we.weight + dist_u:
                 distances[we.v] = we.weight + dist_u  # update distance to this vertex
                 path_dict[we.v] = we  # update the edge on the shortest path to this vertex
-                pq.push(DijkstraNode(we.v, we.weight + dist_u))  # explore it soon
+                pq.push_or_decrease(we.v, we.weight + dist_u)  # explore it soon
 
     return distances, path_dict
 
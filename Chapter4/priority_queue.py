@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Dict, Generic, List, TypeVar
 from heapq import heappush, heappop
 
 
@@ -21,3 +21,114 @@ class PriorityQueue(Generic[T]):
 
     def __repr__(self) -> str:
         return repr(self._container)
+
+
+# Indexed d-ary min-heap: every item is in the queue at most once, with a position map that lets
+# its priority be lowered in place (decrease-key) instead of pushing a duplicate entry and
+# skipping stale ones later. Items must be hashable.
+class IndexedPriorityQueue(Generic[T]):
+    def __init__(self, arity: int = 4) -> None:
+        if arity < 2:
+            raise ValueError('A heap needs an arity of at least 2, got {}'.format(arity))
+        self._arity: int = arity
+        self._items: List[T] = []
+        self._priorities: List[float] = []
+        self._positions: Dict[T, int] = {}  # item -> index in the heap
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def priority(self, item: T) -> float:
+        return self._priorities[self._positions[item]]
+
+    def push(self, item: T, priority: float) -> None:
+        if item in self._positions:
+            raise KeyError('Item already in the queue: {!r}'.format(item))
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._positions[item] = len(self._items) - 1
+        self._sift_up(len(self._items) - 1)
+
+    def decrease_key(self, item: T, priority: float) -> None:
+        index: int = self._positions[item]
+        if priority > self._priorities[index]:
+            raise ValueError('New priority {} is higher than {}'.format(
+                priority, self._priorities[index]))
+        self._priorities[index] = priority
+        self._sift_up(index)
+
+    # push a new item, or lower the priority of a queued one; returns False if nothing changed
+    def push_or_decrease(self, item: T, priority: float) -> bool:
+        if item not in self._positions:
+            self.push(item, priority)
+        elif priority < self._priorities[self._positions[item]]:
+            self.decrease_key(item, priority)
+        else:
+            return False
+        return True
+
+    def peek(self) -> T:
+        if not self._items:
+            raise IndexError('peek from an empty priority queue')
+        return self._items[0]
+
+    def pop(self) -> T:
+        if not self._items:
+            raise IndexError('pop from an empty priority queue')
+        top: T = self._items[0]
+        last_item: T = self._items.pop()
+        last_priority: float = self._priorities.pop()
+        del self._positions[top]
+        if self._items:  # move the last leaf to the root and let it sink
+            self._items[0] = last_item
+            self._priorities[0] = last_priority
+            self._positions[last_item] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, index: int) -> None:
+        item: T = self._items[index]
+        priority: float = self._priorities[index]
+        while index > 0:
+            parent: int = (index - 1) // self._arity
+            if not priority < self._priorities[parent]:
+                break
+            self._move(parent, index)
+            index = parent
+        self._place(item, priority, index)
+
+    def _sift_down(self, index: int) -> None:
+        item: T = self._items[index]
+        priority: float = self._priorities[index]
+        size: int = len(self._items)
+        while True:
+            first: int = index * self._arity + 1
+            if first >= size:
+                break
+            last: int = min(first + self._arity, size)
+            child: int = min(range(first, last), key=self._priorities.__getitem__)
+            if not self._priorities[child] < priority:
+                break
+            self._move(child, index)
+            index = child
+        self._place(item, priority, index)
+
+    def _move(self, source: int, target: int) -> None:
+        self._items[target] = self._items[source]
+        self._priorities[target] = self._priorities[source]
+        self._positions[self._items[target]] = target
+
+    def _place(self, item: T, priority: float, index: int) -> None:
+        self._items[index] = item
+        self._priorities[index] = priority
+        self._positions[item] = index
+
+    def __repr__(self) -> str:
+        return repr(list(zip(self._items, self._priorities)))